@@ -10,6 +10,7 @@ from .collateral_agent import CollateralVerificationAgent
 from .critique_agent import CritiqueAgent
 from .final_decision_agent import FinalDecisionAgent
 from .testing_agent import TestingAgent
+from .errors import TransientAgentError
 
 __all__ = [
     "GreetingAgent",
@@ -19,5 +20,6 @@ __all__ = [
     "CollateralVerificationAgent",
     "CritiqueAgent",
     "FinalDecisionAgent",
-    "TestingAgent"
+    "TestingAgent",
+    "TransientAgentError"
 ]
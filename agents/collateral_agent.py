@@ -4,7 +4,7 @@ Validates collateral value and calculates loan-to-value ratios
 """
 import logging
 from models import CollateralVerificationResponse, LoanApplicationRequest
-from prompts import COLLATERAL_MESSAGES, LTV_CONFIG, RISK_THRESHOLDS
+from prompts import COLLATERAL_MESSAGES, COLLATERAL_FORMATTERS, LTV_CONFIG, RISK_THRESHOLDS
 
 logger = logging.getLogger(__name__)
 
@@ -77,25 +77,26 @@ class CollateralVerificationAgent:
             # Generate detailed analysis
             analysis_parts = []
             messages = COLLATERAL_MESSAGES
+            formatters = COLLATERAL_FORMATTERS
             thresholds = LTV_CONFIG["coverage_thresholds"]
             ltv_thresholds = RISK_THRESHOLDS["ltv_ratio"]
             
             # Collateral value assessment
-            analysis_parts.append(messages["value_statement"].format(value=application.collateral_value))
+            analysis_parts.append(formatters["value_statement"](value=application.collateral_value))
             
             # LTV ratio analysis
             if ltv_ratio <= ltv_thresholds["standard"]:
                 analysis_parts.append(
-                    messages["excellent_ltv"].format(ltv=ltv_ratio, threshold=self.ltv_ratio)
+                    formatters["excellent_ltv"](ltv=ltv_ratio, threshold=self.ltv_ratio)
                 )
             elif ltv_ratio <= ltv_thresholds["acceptable"]:
-                analysis_parts.append(messages["acceptable_ltv"].format(ltv=ltv_ratio))
+                analysis_parts.append(formatters["acceptable_ltv"](ltv=ltv_ratio))
             else:
-                analysis_parts.append(messages["high_ltv"].format(ltv=ltv_ratio))
+                analysis_parts.append(formatters["high_ltv"](ltv=ltv_ratio))
             
             # Margin application
             analysis_parts.append(
-                messages["margin_applied"].format(
+                formatters["margin_applied"](
                     margin=self.ltv_ratio,
                     coverage=effective_collateral,
                     percentage=effective_coverage
@@ -105,10 +106,10 @@ class CollateralVerificationAgent:
             # Sufficiency assessment
             if collateral_sufficient:
                 surplus = effective_collateral - application.loan_amount
-                analysis_parts.append(messages["sufficient_with_surplus"].format(surplus=surplus))
+                analysis_parts.append(formatters["sufficient_with_surplus"](surplus=surplus))
             else:
                 shortfall = application.loan_amount - effective_collateral
-                analysis_parts.append(messages["insufficient_shortfall"].format(shortfall=shortfall))
+                analysis_parts.append(formatters["insufficient_shortfall"](shortfall=shortfall))
             
             # Risk assessment
             if effective_coverage >= thresholds["excellent"]:
@@ -4,7 +4,7 @@ Performs deterministic credit score calculation and risk assessment
 """
 import logging
 from models import CreditHistoryResponse, LoanApplicationRequest, RiskCategory
-from prompts import CREDIT_ANALYSIS_MESSAGES, RISK_THRESHOLDS, CREDIT_SCORE_PARAMS
+from prompts import CREDIT_ANALYSIS_MESSAGES, CREDIT_ANALYSIS_FORMATTERS, RISK_THRESHOLDS, CREDIT_SCORE_PARAMS
 
 logger = logging.getLogger(__name__)
 
@@ -118,41 +118,42 @@ class CreditHistoryAgent:
             # Generate analysis
             analysis_parts = []
             messages = CREDIT_ANALYSIS_MESSAGES
+            formatters = CREDIT_ANALYSIS_FORMATTERS
             thresholds = RISK_THRESHOLDS
             
             # Credit score analysis
             if credit_score >= thresholds["credit_score"]["excellent"]:
-                analysis_parts.append(messages["excellent_score"].format(score=credit_score))
+                analysis_parts.append(formatters["excellent_score"](score=credit_score))
             elif credit_score >= thresholds["credit_score"]["fair"]:
-                analysis_parts.append(messages["fair_score"].format(score=credit_score))
+                analysis_parts.append(formatters["fair_score"](score=credit_score))
             else:
-                analysis_parts.append(messages["below_average_score"].format(score=credit_score))
+                analysis_parts.append(formatters["below_average_score"](score=credit_score))
             
             # Repayment history analysis
             if application.repayment_score >= thresholds["repayment_score"]["strong"]:
-                analysis_parts.append(messages["strong_repayment"].format(score=application.repayment_score))
+                analysis_parts.append(formatters["strong_repayment"](score=application.repayment_score))
             elif application.repayment_score >= thresholds["repayment_score"]["acceptable"]:
-                analysis_parts.append(messages["acceptable_repayment"].format(score=application.repayment_score))
+                analysis_parts.append(formatters["acceptable_repayment"](score=application.repayment_score))
             else:
-                analysis_parts.append(messages["concerning_repayment"].format(score=application.repayment_score))
+                analysis_parts.append(formatters["concerning_repayment"](score=application.repayment_score))
             
             # Existing loans analysis
             if application.existing_loans == 0:
                 analysis_parts.append(messages["no_loans"])
             elif application.existing_loans <= 2:
-                analysis_parts.append(messages["manageable_loans"].format(count=application.existing_loans))
+                analysis_parts.append(formatters["manageable_loans"](count=application.existing_loans))
             else:
-                analysis_parts.append(messages["high_debt_burden"].format(count=application.existing_loans))
+                analysis_parts.append(formatters["high_debt_burden"](count=application.existing_loans))
             
             # Debt-to-income analysis
             if debt_to_income_ratio < thresholds["dti_ratio"]["healthy"]:
-                analysis_parts.append(messages["healthy_dti"].format(ratio=debt_to_income_ratio))
+                analysis_parts.append(formatters["healthy_dti"](ratio=debt_to_income_ratio))
             elif debt_to_income_ratio < thresholds["dti_ratio"]["moderate"]:
-                analysis_parts.append(messages["moderate_dti"].format(ratio=debt_to_income_ratio))
+                analysis_parts.append(formatters["moderate_dti"](ratio=debt_to_income_ratio))
             else:
-                analysis_parts.append(messages["high_dti"].format(ratio=debt_to_income_ratio))
+                analysis_parts.append(formatters["high_dti"](ratio=debt_to_income_ratio))
             
-            analysis = messages["analysis_template"].format(
+            analysis = formatters["analysis_template"](
                 details=', '.join(analysis_parts),
                 risk_level=risk_category.value
             )
@@ -6,7 +6,7 @@ import logging
 import os
 from typing import Dict, Any
 from models import EmploymentVerificationResponse, LoanApplicationRequest
-from prompts import EMPLOYMENT_MESSAGES, KNOWN_COMPANIES, RISK_THRESHOLDS
+from prompts import EMPLOYMENT_MESSAGES, EMPLOYMENT_FORMATTERS, KNOWN_COMPANIES, RISK_THRESHOLDS
 
 logger = logging.getLogger(__name__)
 
@@ -164,11 +164,12 @@ class EmploymentVerificationAgent:
             # Generate analysis
             analysis_parts = []
             messages = EMPLOYMENT_MESSAGES
+            formatters = EMPLOYMENT_FORMATTERS
             thresholds = RISK_THRESHOLDS["employment_years"]
             
             if employment_verified:
                 analysis_parts.append(
-                    messages["verified_template"].format(
+                    formatters["verified_template"](
                         company=application.company_name,
                         years=application.employment_years
                     )
@@ -178,7 +179,7 @@ class EmploymentVerificationAgent:
             
             if company_verified:
                 analysis_parts.append(
-                    messages["company_verified"].format(company=application.company_name)
+                    formatters["company_verified"](company=application.company_name)
                 )
             else:
                 analysis_parts.append(messages["company_inconclusive"])
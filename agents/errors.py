@@ -0,0 +1,8 @@
+"""
+Agent Errors
+Exceptions raised by agents to signal how the orchestrator should react
+"""
+
+
+class TransientAgentError(Exception):
+    """Raised by an agent for a temporary failure that is safe to retry"""
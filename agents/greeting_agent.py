@@ -5,7 +5,7 @@ Sends initial acknowledgment and welcomes the applicant
 import logging
 from datetime import datetime
 from models import GreetingResponse
-from prompts import GREETING_TEMPLATES
+from prompts import GREETING_FORMATTERS
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ class GreetingAgent:
         try:
             logger.info(f"Processing greeting for {applicant_name}")
             
-            message = GREETING_TEMPLATES["welcome_message"].format(
+            message = GREETING_FORMATTERS["welcome_message"](
                 applicant_name=applicant_name,
                 application_id=application_id
             )
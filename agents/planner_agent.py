@@ -4,7 +4,7 @@ Creates verification strategy and breaks down the loan verification process
 """
 import logging
 from models import PlannerResponse, LoanApplicationRequest
-from prompts import PLANNER_MESSAGES
+from prompts import PLANNER_MESSAGES, PLANNER_FORMATTERS
 
 logger = logging.getLogger(__name__)
 
@@ -30,20 +30,20 @@ class PlannerAgent:
             logger.info(f"Creating verification plan for {application.name}")
             
             # Use plan from prompts
-            plan = PLANNER_MESSAGES["verification_plan"].copy()
+            plan = list(PLANNER_MESSAGES["verification_plan"])
             
             # Define detailed verification steps
             verification_steps = {
-                "credit_history": PLANNER_MESSAGES["credit_step"].format(
+                "credit_history": PLANNER_FORMATTERS["credit_step"](
                     loans=application.existing_loans,
                     score=application.repayment_score,
                     income=application.loan_amount
                 ),
-                "employment": PLANNER_MESSAGES["employment_step"].format(
+                "employment": PLANNER_FORMATTERS["employment_step"](
                     company=application.company_name,
                     years=application.employment_years
                 ),
-                "collateral": PLANNER_MESSAGES["collateral_step"].format(
+                "collateral": PLANNER_FORMATTERS["collateral_step"](
                     collateral=application.collateral_value,
                     loan=application.loan_amount
                 ),
@@ -7,6 +7,28 @@ from datetime import datetime
 import json
 
 
+def _weighted_test_score(accuracy: float, fairness_score: float,
+                         average_confidence: float, anomaly_count: int) -> float:
+    """
+    Combine the numeric check results into the overall test score (0-1)
+    
+    Args:
+        accuracy: Validation accuracy (0-100)
+        fairness_score: Fairness score (0-100)
+        average_confidence: Average agent confidence (0-1)
+        anomaly_count: Number of anomalies detected
+        
+    Returns:
+        float: Weighted test score
+    """
+    validation_score = accuracy / 100 * 0.35
+    bias_score = fairness_score / 100 * 0.30
+    performance_score = average_confidence * 0.20
+    anomaly_score = (1 - anomaly_count * 0.1) * 0.15
+    
+    return round(validation_score + bias_score + performance_score + max(0, anomaly_score), 3)
+
+
 class TestingAgent:
     """
     Automated Testing Agent that validates loan decisions and system behavior.
@@ -64,7 +86,33 @@ class TestingAgent:
         Returns:
             Dictionary containing test results and validation status
         """
-        test_id = f"TEST-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        return self._analyze(application, decision_result, datetime.now())
+    
+    def analyze_batch(self, applications: List[Dict[str, Any]],
+                      decision_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze a batch of loan decisions in a single call.
+        
+        Cases are analyzed in order, so consistency checks see earlier cases
+        of the same batch; the timestamp is taken once for the whole batch.
+        
+        Args:
+            applications: The loan application data, one per case
+            decision_results: The decisions made by the orchestrator, in the same order
+            
+        Returns:
+            List of test reports, one per case
+        """
+        now = datetime.now()
+        return [
+            self._analyze(application, decision_result, now)
+            for application, decision_result in zip(applications, decision_results)
+        ]
+    
+    def _analyze(self, application: Dict[str, Any], decision_result: Dict[str, Any],
+                 now: datetime) -> Dict[str, Any]:
+        """Build and record the test report for one decision"""
+        test_id = f"TEST-{now.strftime('%Y%m%d%H%M%S')}"
         
         # Extract decision details
         final_decision = decision_result.get("final_decision", "UNKNOWN")
@@ -93,7 +141,7 @@ class TestingAgent:
         # Generate test report
         test_report = {
             "test_id": test_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "application_id": application.get("name", "Unknown"),
             "final_decision": final_decision,
             "confidence_score": confidence,
@@ -343,14 +391,12 @@ class TestingAgent:
     def _calculate_test_score(self, validation: Dict, bias: Dict, 
                              performance: Dict, anomalies: Dict) -> float:
         """Calculate overall test score (0-1)"""
-        # Weighted scoring
-        validation_score = validation.get("accuracy", 0) / 100 * 0.35
-        bias_score = bias.get("fairness_score", 0) / 100 * 0.30
-        performance_score = performance.get("average_confidence", 0) * 0.20
-        anomaly_score = (1 - (anomalies.get("anomalies_detected", 0) * 0.1)) * 0.15
-        
-        total_score = validation_score + bias_score + performance_score + max(0, anomaly_score)
-        return round(total_score, 3)
+        return _weighted_test_score(
+            validation.get("accuracy", 0),
+            bias.get("fairness_score", 0),
+            performance.get("average_confidence", 0),
+            anomalies.get("anomalies_detected", 0)
+        )
     
     def _calculate_risk_level(self, anomalies: List[Dict]) -> str:
         """Calculate risk level based on anomalies"""
@@ -79,6 +79,18 @@ class Database:
                 )
             """)
             
+            # Create workflow_state table for per-stage resume
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS workflow_state (
+                    application_id TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (application_id, stage),
+                    FOREIGN KEY (application_id) REFERENCES applications(application_id)
+                )
+            """)
+            
             # Create indexes for better query performance
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_application_id 
@@ -268,6 +280,92 @@ class Database:
             logger.error(f"Failed to save final decision: {e}")
             return False
     
+    def save_state(
+        self,
+        application_id: str,
+        stage: str,
+        data: Dict[str, Any]
+    ) -> bool:
+        """
+        Persist the serialized output of a completed workflow stage
+        
+        Args:
+            application_id: Application ID
+            stage: Stage (agent) name
+            data: Serialized agent response
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT OR REPLACE INTO workflow_state (
+                        application_id, stage, data, updated_at
+                    ) VALUES (?, ?, ?, ?)
+                """, (
+                    application_id,
+                    stage,
+                    json.dumps(data),
+                    datetime.now().isoformat()
+                ))
+                
+                logger.info(f"Saved workflow state for {application_id}: {stage}")
+                return True
+        except Exception as e:
+            logger.error(f"Failed to save workflow state: {e}")
+            return False
+    
+    def load_state(self, application_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load persisted workflow stage outputs for an application
+        
+        Args:
+            application_id: Application ID
+            
+        Returns:
+            Dict: Serialized agent responses keyed by stage name
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT stage, data FROM workflow_state
+                    WHERE application_id = ?
+                """, (application_id,))
+                
+                return {
+                    row["stage"]: json.loads(row["data"])
+                    for row in cursor.fetchall()
+                }
+        except Exception as e:
+            logger.error(f"Failed to load workflow state: {e}")
+            return {}
+    
+    def clear_state(self, application_id: str) -> bool:
+        """
+        Delete persisted workflow stage outputs for an application
+        
+        Args:
+            application_id: Application ID
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    DELETE FROM workflow_state WHERE application_id = ?
+                """, (application_id,))
+                
+                logger.info(f"Cleared workflow state for {application_id}")
+                return True
+        except Exception as e:
+            logger.error(f"Failed to clear workflow state: {e}")
+            return False
+    
     def get_application(self, application_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve application by ID
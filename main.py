@@ -8,7 +8,7 @@ from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
@@ -58,6 +58,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Agentic AI Loan Eligibility Verification System")
+    await orchestrator.wait_for_pending()
 
 
 # Initialize FastAPI app
@@ -230,7 +231,13 @@ async def apply_for_loan(application: LoanApplicationRequest):
             f"Decision: {result.decision}"
         )
         
-        return result
+        # Serialize straight to UTF-8 bytes in pydantic-core, skipping
+        # jsonable_encoder and a separate str-to-bytes encode of the
+        # long greeting and reasoning strings
+        return Response(
+            content=result.__pydantic_serializer__.to_json(result),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
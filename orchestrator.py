@@ -2,11 +2,16 @@
 Orchestrator Agent
 Coordinates all sub-agents and manages the loan application workflow
 """
+import asyncio
 import logging
+import os
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Type, Callable, Awaitable
 from uuid import uuid4
 
+from pydantic import BaseModel
+
 from models import (
     LoanApplicationRequest,
     LoanApplicationResponse,
@@ -19,6 +24,7 @@ from models import (
     FinalDecisionResponse
 )
 from database import db
+from prompts import COORDINATION_RULES
 from agents import (
     GreetingAgent,
     PlannerAgent,
@@ -26,10 +32,71 @@ from agents import (
     EmploymentVerificationAgent,
     CollateralVerificationAgent,
     CritiqueAgent,
-    FinalDecisionAgent
+    FinalDecisionAgent,
+    TransientAgentError
 )
 
-logger = logging.getLogger(__name__)
+# Application ID bound to the request currently being processed
+_APP_ID: ContextVar[str] = ContextVar("app_id", default="-")
+
+
+class ApplicationLoggerAdapter(logging.LoggerAdapter):
+    """
+    Logger adapter that tags every record with the application ID bound
+    to the current context, so log calls don't have to thread it through
+    """
+    
+    def process(self, msg, kwargs):
+        app_id = _APP_ID.get()
+        kwargs["extra"] = {**kwargs.get("extra", {}), "app_id": app_id}
+        if app_id == "-":
+            return msg, kwargs
+        return f"[{app_id}] {msg}", kwargs
+
+
+logger = ApplicationLoggerAdapter(logging.getLogger(__name__), {})
+
+
+async def _retry(
+    factory: Callable[[], Awaitable[BaseModel]],
+    retries: int,
+    base_backoff: float,
+    timeout: float,
+    gate: Optional[asyncio.Semaphore] = None
+) -> BaseModel:
+    """
+    Await an agent call with a timeout, retrying transient failures
+    
+    Args:
+        factory: Zero-argument coroutine factory, called once per attempt
+        retries: Number of retries after the first attempt
+        base_backoff: Backoff before the first retry, doubled on each retry
+        timeout: Per-attempt timeout in seconds
+        gate: Semaphore held for each attempt; waiting for a slot does not
+            count against the timeout, and the slot is released during backoff
+        
+    Returns:
+        BaseModel: Agent response
+    """
+    for attempt in range(retries + 1):
+        try:
+            if gate is None:
+                return await asyncio.wait_for(factory(), timeout)
+            async with gate:
+                return await asyncio.wait_for(factory(), timeout)
+        except (asyncio.TimeoutError, TransientAgentError) as e:
+            if attempt == retries:
+                raise
+            delay = base_backoff * 2 ** attempt
+            logger.warning(
+                f"Attempt {attempt + 1} failed ({type(e).__name__}), "
+                f"retrying in {delay}s"
+            )
+            await asyncio.sleep(delay)
+
+# Stages with user-facing side effects (the applicant acknowledgment) are
+# always re-run on resume instead of being rehydrated from workflow_state
+NOT_PERSISTABLE_STAGES = {"greeting_agent"}
 
 
 class OrchestratorAgent:
@@ -51,6 +118,16 @@ class OrchestratorAgent:
         self.critique_agent = CritiqueAgent()
         self.final_decision_agent = FinalDecisionAgent()
         
+        # Limits concurrent verification agent calls across all applications
+        self.max_concurrent_calls = int(os.getenv(
+            "MAX_CONCURRENT_LLM",
+            COORDINATION_RULES["max_concurrent_calls"]
+        ))
+        self._llm_sem = asyncio.Semaphore(self.max_concurrent_calls)
+        
+        # Background finalization tasks not yet completed
+        self._pending_tasks: Set[asyncio.Task] = set()
+        
         logger.info(f"{self.name} initialized with all sub-agents")
     
     def generate_application_id(self) -> str:
@@ -64,136 +141,245 @@ class OrchestratorAgent:
         unique_id = str(uuid4())[:8].upper()
         return f"APP-{date_str}-{unique_id}"
     
+    async def _run_stage(
+        self,
+        application_id: str,
+        agent_name: str,
+        response_model: Type[BaseModel],
+        resume_from: Dict[str, Dict[str, Any]],
+        stage: str,
+        run: Callable[[], Awaitable[BaseModel]],
+        gated: bool = False
+    ) -> BaseModel:
+        """
+        Run a single workflow stage, or rehydrate it from persisted state
+        
+        The agent call is bounded by the stage timeout and retried according
+        to COORDINATION_RULES.
+        
+        Args:
+            application_id: Application ID
+            agent_name: Name of the agent executing the stage
+            response_model: Pydantic model of the agent response
+            resume_from: Persisted stage outputs keyed by agent name
+            stage: Stage name in COORDINATION_RULES["timeout_seconds"]
+            run: Zero-argument coroutine factory that executes the agent
+            gated: Hold a verification concurrency slot for each attempt
+            
+        Returns:
+            BaseModel: Agent response
+        """
+        persistable = agent_name not in NOT_PERSISTABLE_STAGES
+        
+        if persistable and agent_name in resume_from:
+            logger.info(f"Resuming {agent_name} from saved state")
+            return response_model.model_validate(resume_from[agent_name])
+        
+        retry_policy = COORDINATION_RULES["retry_policy"]
+        response = await _retry(
+            run,
+            retries=retry_policy["max_retries"],
+            base_backoff=retry_policy["backoff_seconds"],
+            timeout=COORDINATION_RULES["timeout_seconds"][stage],
+            gate=self._llm_sem if gated else None
+        )
+        data = response.model_dump()
+        
+        db.save_agent_result(application_id, agent_name, True, data)
+        if persistable:
+            db.save_state(application_id, agent_name, data)
+        
+        return response
+    
+    def _schedule_finalize(
+        self,
+        application_id: str,
+        final_response: FinalDecisionResponse
+    ) -> None:
+        """
+        Schedule the final decision write as a background task
+        
+        Args:
+            application_id: Application ID
+            final_response: Final decision agent response
+        """
+        task = asyncio.create_task(self._finalize(application_id, final_response))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+    
+    async def _finalize(
+        self,
+        application_id: str,
+        final_response: FinalDecisionResponse
+    ) -> None:
+        """
+        Save the final decision to the database
+        
+        Runs after the response has been returned, so failures are only logged.
+        Once the decision is saved the per-stage resume state is deleted.
+        
+        Args:
+            application_id: Application ID
+            final_response: Final decision agent response
+        """
+        try:
+            saved = await asyncio.to_thread(
+                db.save_final_decision,
+                application_id,
+                final_response.model_dump()
+            )
+            if saved:
+                await asyncio.to_thread(db.clear_state, application_id)
+        except Exception:
+            logger.exception("Failed to save final decision")
+    
+    async def wait_for_pending(self) -> None:
+        """Wait for outstanding background finalization tasks on the running loop"""
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._pending_tasks if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    
     async def process_application(
         self,
-        application: LoanApplicationRequest
+        application: LoanApplicationRequest,
+        application_id: Optional[str] = None
     ) -> LoanApplicationResponse:
         """
         Process loan application through all agents
         
         Args:
             application: Loan application request
+            application_id: Existing application ID to resume after a restart;
+                stages whose output was already persisted are not re-run
             
         Returns:
             LoanApplicationResponse: Final decision with complete analysis
+            
+        Raises:
+            ValueError: If the application does not match the one stored
+                under application_id
         """
-        application_id = self.generate_application_id()
+        resume_from: Dict[str, Dict[str, Any]] = {}
+        if application_id is not None:
+            stored = db.get_application(application_id)
+            if stored and stored["application_data"] != application.model_dump():
+                raise ValueError(
+                    f"Application does not match stored data for {application_id}"
+                )
+            resume_from = db.load_state(application_id)
+        else:
+            application_id = self.generate_application_id()
+        
+        token = _APP_ID.set(application_id)
         
         try:
-            logger.info(f"Starting application processing: {application_id}")
+            logger.info("Starting application processing")
             
             # Create database record
-            db.create_application(
-                application_id=application_id,
-                applicant_name=application.name,
-                application_data=application.model_dump()
-            )
+            if not db.get_application(application_id):
+                db.create_application(
+                    application_id=application_id,
+                    applicant_name=application.name,
+                    application_data=application.model_dump()
+                )
             
             # Stage 1: Greeting
-            logger.info(f"[{application_id}] Stage 1: Greeting")
+            logger.info("Stage 1: Greeting")
             db.update_stage(application_id, "greeting")
             
-            greeting_response = await self.greeting_agent.process(
-                application_id,
-                application.name
-            )
-            
-            db.save_agent_result(
+            greeting_response = await self._run_stage(
                 application_id,
                 "greeting_agent",
-                True,
-                greeting_response.model_dump()
+                GreetingResponse,
+                resume_from,
+                "greeting",
+                lambda: self.greeting_agent.process(application_id, application.name)
             )
             
             # Stage 2: Planning
-            logger.info(f"[{application_id}] Stage 2: Planning")
+            logger.info("Stage 2: Planning")
             db.update_stage(application_id, "planning")
             
-            planner_response = await self.planner_agent.process(application)
-            
-            db.save_agent_result(
+            planner_response = await self._run_stage(
                 application_id,
                 "planner_agent",
-                True,
-                planner_response.model_dump()
+                PlannerResponse,
+                resume_from,
+                "planning",
+                lambda: self.planner_agent.process(application)
             )
             
             # Stage 3: Parallel Verification (Credit, Employment, Collateral)
-            logger.info(f"[{application_id}] Stage 3: Parallel Verification")
+            logger.info("Stage 3: Parallel Verification")
             db.update_stage(application_id, "verification")
             
-            # Credit History Verification
-            logger.info(f"[{application_id}] Running Credit History Agent")
-            credit_response = await self.credit_history_agent.process(application)
-            
-            db.save_agent_result(
-                application_id,
-                "credit_history_agent",
-                True,
-                credit_response.model_dump()
-            )
-            
-            # Employment Verification
-            logger.info(f"[{application_id}] Running Employment Verification Agent")
-            employment_response = await self.employment_agent.process(application)
-            
-            db.save_agent_result(
-                application_id,
-                "employment_verification_agent",
-                True,
-                employment_response.model_dump()
-            )
-            
-            # Collateral Verification
-            logger.info(f"[{application_id}] Running Collateral Verification Agent")
-            collateral_response = await self.collateral_agent.process(application)
-            
-            db.save_agent_result(
-                application_id,
-                "collateral_verification_agent",
-                True,
-                collateral_response.model_dump()
+            # Credit History, Employment and Collateral run concurrently,
+            # gated by the shared verification semaphore
+            logger.info("Running Credit History, Employment and Collateral Agents")
+            credit_response, employment_response, collateral_response = await asyncio.gather(
+                self._run_stage(
+                    application_id,
+                    "credit_history_agent",
+                    CreditHistoryResponse,
+                    resume_from,
+                    "verification",
+                    lambda: self.credit_history_agent.process(application),
+                    gated=True
+                ),
+                self._run_stage(
+                    application_id,
+                    "employment_verification_agent",
+                    EmploymentVerificationResponse,
+                    resume_from,
+                    "verification",
+                    lambda: self.employment_agent.process(application),
+                    gated=True
+                ),
+                self._run_stage(
+                    application_id,
+                    "collateral_verification_agent",
+                    CollateralVerificationResponse,
+                    resume_from,
+                    "verification",
+                    lambda: self.collateral_agent.process(application),
+                    gated=True
+                )
             )
             
             # Stage 4: Critique
-            logger.info(f"[{application_id}] Stage 4: Critique")
+            logger.info("Stage 4: Critique")
             db.update_stage(application_id, "critique")
             
-            critique_response = await self.critique_agent.process(
-                credit_response,
-                employment_response,
-                collateral_response
-            )
-            
-            db.save_agent_result(
+            critique_response = await self._run_stage(
                 application_id,
                 "critique_agent",
-                True,
-                critique_response.model_dump()
+                CritiqueResponse,
+                resume_from,
+                "critique",
+                lambda: self.critique_agent.process(
+                    credit_response,
+                    employment_response,
+                    collateral_response
+                )
             )
             
             # Stage 5: Final Decision
-            logger.info(f"[{application_id}] Stage 5: Final Decision")
+            logger.info("Stage 5: Final Decision")
             db.update_stage(application_id, "final_decision")
             
-            final_response = await self.final_decision_agent.process(
-                credit_response,
-                employment_response,
-                collateral_response,
-                critique_response
-            )
-            
-            db.save_agent_result(
+            final_response = await self._run_stage(
                 application_id,
                 "final_decision_agent",
-                True,
-                final_response.model_dump()
-            )
-            
-            # Save final decision to database
-            db.save_final_decision(
-                application_id,
-                final_response.model_dump()
+                FinalDecisionResponse,
+                resume_from,
+                "decision",
+                lambda: self.final_decision_agent.process(
+                    credit_response,
+                    employment_response,
+                    collateral_response,
+                    critique_response
+                )
             )
             
             # Compile agent summary
@@ -251,8 +437,11 @@ class OrchestratorAgent:
                 timestamp=datetime.now().isoformat()
             )
             
+            # Persist the final decision off the response path
+            self._schedule_finalize(application_id, final_response)
+            
             logger.info(
-                f"[{application_id}] Processing complete: "
+                "Processing complete: "
                 f"Decision={final_response.decision.value}, "
                 f"Risk={final_response.risk_score:.2%}"
             )
@@ -260,7 +449,7 @@ class OrchestratorAgent:
             return final_api_response
             
         except Exception as e:
-            logger.error(f"[{application_id}] Error processing application: {e}")
+            logger.error(f"Error processing application: {e}")
             
             # Save error to database
             db.save_agent_result(
@@ -273,6 +462,37 @@ class OrchestratorAgent:
             
             # Return error response
             raise Exception(f"Failed to process loan application: {str(e)}")
+        finally:
+            _APP_ID.reset(token)
+    
+    async def process_batch(
+        self,
+        applications: List[LoanApplicationRequest],
+        on_complete: Optional[Callable[[int], None]] = None
+    ) -> List[LoanApplicationResponse]:
+        """
+        Process several loan applications concurrently
+        
+        Each application runs the full workflow in its own task; verification
+        calls across the batch share the LLM concurrency limit.
+        
+        Args:
+            applications: Loan application requests
+            on_complete: Called with an application's index as soon as its
+                decision is ready, for progress reporting
+            
+        Returns:
+            List[LoanApplicationResponse]: Final decisions, in input order
+        """
+        async def process(index: int, application: LoanApplicationRequest) -> LoanApplicationResponse:
+            response = await self.process_application(application)
+            if on_complete is not None:
+                on_complete(index)
+            return response
+        
+        return list(await asyncio.gather(
+            *(process(index, application) for index, application in enumerate(applications))
+        ))
     
     def get_application_status(self, application_id: str) -> Dict[str, Any]:
         """
@@ -300,7 +520,8 @@ class OrchestratorAgent:
                 "created_at": application["created_at"],
                 "updated_at": application["updated_at"],
                 "agent_results": application["agent_results"],
-                "final_decision": application["final_decision"]
+                "final_decision": application["final_decision"],
+                "available_verification_slots": self._llm_sem._value
             }
             
         except Exception as e:
@@ -1,7 +1,11 @@
 """
 Prompts Package
 Centralized configuration for all prompts, messages, and system settings
+
+User-facing messages and label tables are loaded lazily (PEP 562), so a
+process only builds the message sets it actually uses.
 """
+from importlib import import_module
 
 from .system_prompts import (
     SYSTEM_INSTRUCTIONS,
@@ -12,19 +16,6 @@ from .system_prompts import (
     COORDINATION_RULES
 )
 
-from .user_prompts import (
-    GREETING_TEMPLATES,
-    CREDIT_ANALYSIS_MESSAGES,
-    EMPLOYMENT_MESSAGES,
-    COLLATERAL_MESSAGES,
-    CRITIQUE_MESSAGES,
-    DECISION_REASONING,
-    PLANNER_MESSAGES,
-    STATUS_LABELS,
-    RISK_LABELS,
-    VERIFICATION_LABELS
-)
-
 from .config import (
     RISK_THRESHOLDS,
     CREDIT_SCORE_PARAMS,
@@ -55,6 +46,13 @@ __all__ = [
     'STATUS_LABELS',
     'RISK_LABELS',
     'VERIFICATION_LABELS',
+    'GREETING_FORMATTERS',
+    'CREDIT_ANALYSIS_FORMATTERS',
+    'EMPLOYMENT_FORMATTERS',
+    'COLLATERAL_FORMATTERS',
+    'CRITIQUE_FORMATTERS',
+    'DECISION_FORMATTERS',
+    'PLANNER_FORMATTERS',
     
     # Configuration
     'RISK_THRESHOLDS',
@@ -65,3 +63,39 @@ __all__ = [
     'STATUS_FLOW',
     'VERIFICATION_CRITERIA'
 ]
+
+# Lazily loaded attributes, mapped to the submodule that defines them
+_LAZY_ATTRS = {
+    'GREETING_TEMPLATES': '._greeting',
+    'GREETING_FORMATTERS': '._greeting',
+    'CREDIT_ANALYSIS_MESSAGES': '._credit',
+    'CREDIT_ANALYSIS_FORMATTERS': '._credit',
+    'EMPLOYMENT_MESSAGES': '._employment',
+    'EMPLOYMENT_FORMATTERS': '._employment',
+    'COLLATERAL_MESSAGES': '._collateral',
+    'COLLATERAL_FORMATTERS': '._collateral',
+    'CRITIQUE_MESSAGES': '._critique',
+    'CRITIQUE_FORMATTERS': '._critique',
+    'DECISION_REASONING': '._decision',
+    'DECISION_FORMATTERS': '._decision',
+    'PLANNER_MESSAGES': '._planner',
+    'PLANNER_FORMATTERS': '._planner',
+    'STATUS_LABELS': '._ui_labels',
+    'RISK_LABELS': '._ui_labels',
+    'VERIFICATION_LABELS': '._ui_labels',
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining a lazily loaded attribute on first access"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
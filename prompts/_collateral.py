@@ -0,0 +1,26 @@
+"""
+Collateral Messages
+Collateral and LTV assessment text
+"""
+from .templating import freeze_and_compile
+
+# Collateral Assessment User Messages
+COLLATERAL_MESSAGES = {
+    "value_statement": "Collateral value: ${value:,.2f}",
+    
+    "excellent_ltv": "Excellent LTV ratio of {ltv:.2%} (well within {threshold:.0%} threshold)",
+    "acceptable_ltv": "Acceptable LTV ratio of {ltv:.2%} (slightly above optimal)",
+    "high_ltv": "High LTV ratio of {ltv:.2%} (exceeds recommended threshold)",
+    
+    "margin_applied": "After applying {margin:.0%} margin, effective coverage is ${coverage:,.2f} ({percentage:.2%} of loan amount)",
+    
+    "sufficient_with_surplus": "Collateral is sufficient with ${surplus:,.2f} surplus after margin",
+    "insufficient_shortfall": "Collateral is insufficient by ${shortfall:,.2f} after applying margin",
+    
+    "low_risk": "Low collateral risk with strong coverage",
+    "acceptable_coverage": "Acceptable collateral coverage",
+    "marginal_coverage": "Marginal collateral coverage - increased risk",
+    "insufficient_coverage": "Insufficient collateral coverage - high risk"
+}
+
+COLLATERAL_MESSAGES, COLLATERAL_FORMATTERS = freeze_and_compile(COLLATERAL_MESSAGES)
@@ -0,0 +1,28 @@
+"""
+Credit Analysis Messages
+Credit score, repayment and DTI analysis text
+"""
+from .templating import freeze_and_compile
+
+# Credit Analysis User Messages
+CREDIT_ANALYSIS_MESSAGES = {
+    "excellent_score": "Excellent credit score of {score:.0f}",
+    "fair_score": "Fair credit score of {score:.0f}",
+    "below_average_score": "Below-average credit score of {score:.0f}",
+    
+    "strong_repayment": "strong repayment history ({score:.2%})",
+    "acceptable_repayment": "acceptable repayment history ({score:.2%})",
+    "concerning_repayment": "concerning repayment history ({score:.2%})",
+    
+    "no_loans": "no existing loans",
+    "manageable_loans": "{count} existing loans (manageable)",
+    "high_debt_burden": "{count} existing loans (high debt burden)",
+    
+    "healthy_dti": "healthy DTI ratio of {ratio:.2%}",
+    "moderate_dti": "moderate DTI ratio of {ratio:.2%}",
+    "high_dti": "high DTI ratio of {ratio:.2%}",
+    
+    "analysis_template": "Applicant shows {details}. Risk level: {risk_level}."
+}
+
+CREDIT_ANALYSIS_MESSAGES, CREDIT_ANALYSIS_FORMATTERS = freeze_and_compile(CREDIT_ANALYSIS_MESSAGES)
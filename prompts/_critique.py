@@ -0,0 +1,32 @@
+"""
+Critique Messages
+Inconsistency, recommendation and summary text
+"""
+from .templating import freeze_and_compile
+
+# Critique Agent User Messages
+CRITIQUE_MESSAGES = {
+    # Inconsistency Messages
+    "low_risk_conflict_employment": "Low credit risk conflicts with concerning employment stability",
+    "high_risk_excellent_employment": "High credit risk despite excellent employment history warrants investigation",
+    "critical_high_risk_no_collateral": "Critical: High credit risk combined with insufficient collateral",
+    "low_risk_high_ltv": "Low credit risk applicant has high LTV ratio - unusual pattern",
+    "all_passed_high_dti": "All verifications passed but DTI ratio is concerning",
+    "all_failed_confirmed": "All verifications failed - confirms high-risk profile",
+    
+    # Recommendation Messages
+    "debt_consolidation": "Consider debt consolidation before reapplying",
+    "credit_counseling": "Recommend credit counseling to improve credit profile",
+    "reapply_after_employment": "Recommend reapplying after 1+ years of employment",
+    "additional_documentation": "Additional employment documentation required",
+    "larger_down_payment": "Collateral shortfall of {shortfall:.0f}% - consider larger down payment",
+    "cosigner_or_collateral": "Consider co-signer or additional collateral",
+    "manual_review": "Manual review recommended due to identified inconsistencies",
+    "proceed_standard": "All verifications consistent - proceed with standard approval process",
+    
+    # Summary Messages
+    "consistent_summary": "All agent outputs are consistent and coherent. Confidence score: {confidence:.2%}. Credit: {risk} risk, Employment: {employment_status}, Collateral: {collateral_status}.",
+    "inconsistencies_summary": "Found {count} inconsistency(ies) requiring attention. Confidence score: {confidence:.2%}. Recommend careful review of highlighted areas."
+}
+
+CRITIQUE_MESSAGES, CRITIQUE_FORMATTERS = freeze_and_compile(CRITIQUE_MESSAGES)
@@ -0,0 +1,23 @@
+"""
+Decision Reasoning
+Final decision explanations
+"""
+from .templating import freeze_and_compile
+
+# Final Decision User Messages
+DECISION_REASONING = {
+    "approved_intro": "After comprehensive multi-agent analysis, the loan application has been approved with an overall risk score of {risk:.2%}.",
+    "conditional_intro": "After comprehensive multi-agent analysis, the loan application has been conditionally approved with an overall risk score of {risk:.2%}.",
+    "rejected_intro": "After comprehensive multi-agent analysis, the loan application has been rejected with an overall risk score of {risk:.2%}.",
+    
+    "approved_rationale": "The applicant demonstrates strong creditworthiness across all verification dimensions. Low risk profile ({risk:.2%}) and consistent positive indicators support approval.",
+    
+    "conditional_rationale": "The applicant shows potential for approval with moderate risk ({risk:.2%}). Conditional approval is granted subject to meeting the following requirements:",
+    
+    "rejected_rationale": "The application presents high risk ({risk:.2%}) with multiple verification concerns. The applicant is encouraged to address the identified issues and reapply in the future.",
+    
+    "conditions_header": "\n\nConditional Requirements:",
+    "recommendations_header": "\n\nRecommendations:"
+}
+
+DECISION_REASONING, DECISION_FORMATTERS = freeze_and_compile(DECISION_REASONING)
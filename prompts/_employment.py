@@ -0,0 +1,24 @@
+"""
+Employment Messages
+Employment and company verification text
+"""
+from .templating import freeze_and_compile
+
+# Employment Verification User Messages
+EMPLOYMENT_MESSAGES = {
+    "verified_template": "Employment verified at {company} for {years} years",
+    "unable_to_verify": "Unable to fully verify employment history",
+    "company_verified": "Company {company} verified through multiple sources",
+    "company_inconclusive": "Company verification inconclusive",
+    
+    "stability_excellent": "Excellent (5+ years)",
+    "stability_good": "Good (3-5 years)",
+    "stability_acceptable": "Acceptable (1-3 years)",
+    "stability_concerning": "Concerning (< 1 year)",
+    
+    "strong_commitment": "Demonstrates strong employment commitment",
+    "reasonable_history": "Shows reasonable employment history",
+    "limited_tenure": "Limited employment tenure raises concerns"
+}
+
+EMPLOYMENT_MESSAGES, EMPLOYMENT_FORMATTERS = freeze_and_compile(EMPLOYMENT_MESSAGES)
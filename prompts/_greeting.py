@@ -0,0 +1,21 @@
+"""
+Greeting Messages
+Welcome message templates for applicants
+"""
+from .templating import freeze_and_compile
+
+# Greeting Agent Templates
+GREETING_TEMPLATES = {
+    "welcome_message": """Dear {applicant_name},
+
+Thank you for submitting your loan application. We have received your request and assigned it the reference number: {application_id}.
+
+Our AI-powered verification system is now processing your application through multiple specialized agents to ensure a comprehensive and fair assessment.
+
+You will receive a detailed response shortly.
+
+Best regards,
+Loan Verification Team"""
+}
+
+GREETING_TEMPLATES, GREETING_FORMATTERS = freeze_and_compile(GREETING_TEMPLATES)
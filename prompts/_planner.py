@@ -0,0 +1,28 @@
+"""
+Planner Messages
+Verification plan text
+"""
+from .templating import freeze_and_compile
+
+# Planner Agent User Messages
+PLANNER_MESSAGES = {
+    "verification_plan": (
+        "Step 1: Credit History Verification",
+        "Step 2: Employment Verification",
+        "Step 3: Collateral Assessment",
+        "Step 4: Cross-verification and Critique",
+        "Step 5: Final Decision Making"
+    ),
+    
+    "credit_step": "Analyze credit profile: {loans} existing loans, repayment score {score}, income ${income:,.2f}",
+    "employment_step": "Verify employment at {company} for {years} years",
+    "collateral_step": "Assess collateral value ${collateral:,.2f} against loan amount ${loan:,.2f}",
+    "critique_step": "Cross-verify all agent outputs for consistency and accuracy",
+    "decision_step": "Synthesize all verification results into final approval decision",
+    
+    "duration_low": "2-3 minutes",
+    "duration_medium": "3-5 minutes",
+    "duration_high": "5-7 minutes"
+}
+
+PLANNER_MESSAGES, PLANNER_FORMATTERS = freeze_and_compile(PLANNER_MESSAGES)
@@ -0,0 +1,35 @@
+"""
+UI Labels
+Status, risk and verification labels shown in the UI
+"""
+from .templating import freeze_messages
+
+# Status Labels for UI
+STATUS_LABELS = {
+    "pending": "Pending Review",
+    "in_progress": "In Progress",
+    "completed": "Completed",
+    "approved": "Approved",
+    "conditional": "Conditionally Approved",
+    "rejected": "Rejected"
+}
+
+# Risk Level Labels for UI
+RISK_LABELS = {
+    "low": "Low Risk",
+    "medium": "Medium Risk",
+    "high": "High Risk"
+}
+
+# Verification Status Labels
+VERIFICATION_LABELS = {
+    "passed": "Passed ✓",
+    "failed": "Failed ✗",
+    "pending": "Pending...",
+    "in_progress": "In Progress..."
+}
+
+# Freeze into read-only mappings
+STATUS_LABELS = freeze_messages(STATUS_LABELS)
+RISK_LABELS = freeze_messages(RISK_LABELS)
+VERIFICATION_LABELS = freeze_messages(VERIFICATION_LABELS)
@@ -177,5 +177,6 @@ COORDINATION_RULES = {
     "retry_policy": {
         "max_retries": 3,
         "backoff_seconds": 2
-    }
+    },
+    "max_concurrent_calls": 10
 }
@@ -0,0 +1,125 @@
+"""
+Template Compilation
+Turns str.format templates into callables that skip format-string parsing
+"""
+import keyword
+import sys
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Tuple
+
+_CONVERSIONS = {"r": "_repr", "s": "_str", "a": "_ascii"}
+
+# Globals of the generated functions; the builtins are bound under private
+# names so template fields such as {format} or {str} cannot shadow them
+_FORMATTER_GLOBALS = {"_format": format, "_repr": repr, "_str": str, "_ascii": ascii}
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Compile a str.format template into an equivalent keyword-only callable
+
+    The template is parsed once; the generated function binds each field's
+    format spec as a constant and assembles the result with a single
+    %-substitution, so no format string is parsed per call. Templates
+    without fields compile to a function returning the constant text.
+
+    Args:
+        template: Trusted str.format template
+
+    Returns:
+        Callable: Function taking the template fields as keyword arguments
+    """
+    plain_parts = []
+    literal_parts = []
+    field_names = set()
+    field_exprs = []
+
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        plain_parts.append(literal)
+        literal_parts.append(literal.replace("%", "%%"))
+        if field_name is None:
+            continue
+
+        # Positional, attribute/index and nested-spec fields keep str.format,
+        # as do names that can't be parameters or could clash with the
+        # private helper names (including the **_ catch-all)
+        if (
+            not field_name.isidentifier()
+            or keyword.iskeyword(field_name)
+            or field_name.startswith("_")
+            or "{" in (format_spec or "")
+        ):
+            return template.format
+
+        value = field_name
+        if conversion is not None:
+            value = f"{_CONVERSIONS[conversion]}({field_name})"
+
+        field_names.add(field_name)
+        literal_parts.append("%s")
+        field_exprs.append(f"_format({value}, {format_spec or ''!r})")
+
+    # No substitutions: return the rendered text as-is on every call
+    if not field_names:
+        text = "".join(plain_parts)
+        return lambda **_: text
+
+    signature = ", ".join(["*", *sorted(field_names), "**_"])
+    body = f"{''.join(literal_parts)!r} % ({''.join(e + ', ' for e in field_exprs)})"
+
+    namespace: Dict[str, Callable[..., str]] = {}
+    exec(f"def _formatter({signature}):\n    return {body}\n", _FORMATTER_GLOBALS, namespace)
+    return namespace["_formatter"]
+
+
+def compile_templates(templates: Mapping[str, str]) -> Dict[str, Callable[..., str]]:
+    """
+    Compile every string template in a message dictionary
+
+    Args:
+        templates: Message dictionary; non-string values are skipped
+
+    Returns:
+        Dict: Compiled formatter per template key
+    """
+    return {
+        key: compile_template(template)
+        for key, template in templates.items()
+        if isinstance(template, str)
+    }
+
+
+def freeze_messages(messages: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Return a read-only view of a message dictionary with interned keys
+
+    Args:
+        messages: Message dictionary
+
+    Returns:
+        Mapping: Read-only proxy over a copy of the dictionary
+    """
+    return MappingProxyType({
+        sys.intern(key): value
+        for key, value in messages.items()
+    })
+
+
+def freeze_and_compile(
+    messages: Mapping[str, Any]
+) -> Tuple[Mapping[str, Any], Mapping[str, Callable[..., str]]]:
+    """
+    Freeze a message dictionary and precompile its string templates
+
+    Message submodules call this once at import time, rebinding the
+    dictionary to the frozen copy and publishing the formatters beside it.
+
+    Args:
+        messages: Message dictionary
+
+    Returns:
+        Tuple: Read-only messages and read-only compiled formatters
+    """
+    frozen = freeze_messages(messages)
+    return frozen, freeze_messages(compile_templates(frozen))
@@ -2,6 +2,7 @@
 Pytest Configuration and Fixtures
 Shared test fixtures and configuration for the test suite
 """
+import asyncio
 import pytest
 import sys
 from pathlib import Path
@@ -10,58 +11,109 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models import LoanApplicationRequest
+from agents.greeting_agent import GreetingAgent
+from agents.credit_history_agent import CreditHistoryAgent
+from agents.employment_agent import EmploymentVerificationAgent
+from agents.collateral_agent import CollateralVerificationAgent
+from agents.testing_agent import TestingAgent
 
 
 # No need for database fixture since we're using the global db instance
 # No need for orchestrator fixture since we're using the global orchestrator instance
 
 
+@pytest.fixture(scope="session")
+def event_loop():
+    """Single event loop shared by every async test in the session"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+# Verification agents are stateless, so one instance is shared per session.
+# TestingAgent keeps a test history, so its fixture is function-scoped.
+@pytest.fixture(scope="session")
+def greeting_agent():
+    """Shared Greeting Agent"""
+    return GreetingAgent()
+
+
+@pytest.fixture(scope="session")
+def credit_agent():
+    """Shared Credit History Agent"""
+    return CreditHistoryAgent()
+
+
+@pytest.fixture(scope="session")
+def employment_agent():
+    """Shared Employment Verification Agent"""
+    return EmploymentVerificationAgent()
+
+
+@pytest.fixture(scope="session")
+def collateral_agent():
+    """Shared Collateral Verification Agent"""
+    return CollateralVerificationAgent()
+
+
 @pytest.fixture
+def testing_agent():
+    """Fresh Testing Agent with an empty test history"""
+    return TestingAgent()
+
+
+@pytest.fixture(scope="session")
 def sample_strong_application():
     """Strong loan application that should be approved"""
-    return {
-        "name": "Test Strong Applicant",
-        "income": 120000.0,
-        "loan_amount": 200000.0,
-        "existing_loans": 1,
-        "repayment_score": 0.92,
-        "employment_years": 8.0,
-        "company_name": "Tech Corp",
-        "collateral_value": 300000.0
-    }
+    return LoanApplicationRequest(
+        name="Test Strong Applicant",
+        income=120000.0,
+        loan_amount=200000.0,
+        existing_loans=1,
+        repayment_score=0.92,
+        employment_years=8.0,
+        company_name="Tech Corp",
+        collateral_value=300000.0
+    )
 
 
 @pytest.fixture
+def sample_strong_application_data(sample_strong_application):
+    """Strong loan application as a raw request payload"""
+    return sample_strong_application.model_dump()
+
+
+@pytest.fixture(scope="session")
 def sample_weak_application():
     """Weak loan application that should be rejected"""
-    return {
-        "name": "Test Weak Applicant",
-        "income": 35000.0,
-        "loan_amount": 250000.0,
-        "existing_loans": 4,
-        "repayment_score": 0.45,
-        "employment_years": 1.0,
-        "company_name": "Startup Inc",
-        "collateral_value": 50000.0
-    }
+    return LoanApplicationRequest(
+        name="Test Weak Applicant",
+        income=35000.0,
+        loan_amount=250000.0,
+        existing_loans=4,
+        repayment_score=0.45,
+        employment_years=1.0,
+        company_name="Startup Inc",
+        collateral_value=50000.0
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_moderate_application():
     """Moderate loan application that might be conditional"""
-    return {
-        "name": "Test Moderate Applicant",
-        "income": 65000.0,
-        "loan_amount": 180000.0,
-        "existing_loans": 2,
-        "repayment_score": 0.72,
-        "employment_years": 4.0,
-        "company_name": "Medium Business",
-        "collateral_value": 200000.0
-    }
+    return LoanApplicationRequest(
+        name="Test Moderate Applicant",
+        income=65000.0,
+        loan_amount=180000.0,
+        existing_loans=2,
+        repayment_score=0.72,
+        employment_years=4.0,
+        company_name="Medium Business",
+        collateral_value=200000.0
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_applications_batch():
     """Batch of diverse loan applications for testing"""
     return [
@@ -96,3 +148,9 @@ def sample_applications_batch():
             "collateral_value": 280000.0
         }
     ]
+
+
+@pytest.fixture(scope="session")
+def sample_applications_batch_models(sample_applications_batch):
+    """Batch of diverse loan applications, validated once per session"""
+    return [LoanApplicationRequest(**app_data) for app_data in sample_applications_batch]
@@ -1,12 +1,8 @@
 """
 Unit tests for all agents in the loan approval system
 """
+import asyncio
 import pytest
-from agents.greeting_agent import GreetingAgent
-from agents.credit_history_agent import CreditHistoryAgent
-from agents.employment_agent import EmploymentVerificationAgent
-from agents.collateral_agent import CollateralVerificationAgent
-from agents.testing_agent import TestingAgent
 from models import LoanApplicationRequest
 
 
@@ -14,9 +10,8 @@ class TestGreetingAgent:
     """Test Greeting Agent"""
     
     @pytest.mark.asyncio
-    async def test_greeting_generation(self):
-        agent = GreetingAgent()
-        result = await agent.process("APP-TEST-001", "John Doe")
+    async def test_greeting_generation(self, greeting_agent):
+        result = await greeting_agent.process("APP-TEST-001", "John Doe")
         
         assert result.message is not None
         assert len(result.message) > 0
@@ -28,62 +23,59 @@ class TestGreetingAgent:
 class TestCreditHistoryAgent:
     """Test Credit History Agent"""
     
+    @pytest.mark.parametrize(
+        "application_fixture, expected_risk, min_score, max_score",
+        [
+            # Strong application should have low risk
+            ("sample_strong_application", ["Low", "Medium"], 700, float("inf")),
+            # Weak application should have high risk
+            ("sample_weak_application", ["High", "Medium"], float("-inf"), 700)
+        ],
+        ids=["excellent_credit", "poor_credit"]
+    )
     @pytest.mark.asyncio
-    async def test_excellent_credit(self, sample_strong_application):
-        agent = CreditHistoryAgent()
-        app = LoanApplicationRequest(**sample_strong_application)
-        result = await agent.process(app)
+    async def test_credit_assessment(
+        self, request, credit_agent, application_fixture, expected_risk, min_score, max_score
+    ):
+        application = request.getfixturevalue(application_fixture)
+        result = await credit_agent.process(application)
         
-        # Strong application should have low risk
-        assert result.risk_category in ["Low", "Medium"]
-        assert result.credit_score > 700
-        assert result.analysis is not None
-    
-    @pytest.mark.asyncio
-    async def test_poor_credit(self, sample_weak_application):
-        agent = CreditHistoryAgent()
-        app = LoanApplicationRequest(**sample_weak_application)
-        result = await agent.process(app)
-        
-        # Weak application should have high risk
-        assert result.risk_category in ["High", "Medium"]
-        assert result.credit_score < 700
+        assert result.risk_category in expected_risk
+        assert min_score < result.credit_score < max_score
         assert result.analysis is not None
 
 
 class TestEmploymentVerificationAgent:
     """Test Employment Verification Agent"""
     
+    @pytest.mark.parametrize(
+        "application_fixture, expected_verified",
+        [
+            # Strong employment history
+            ("sample_strong_application", [True]),
+            # Weak employment history may or may not verify
+            ("sample_weak_application", [True, False])
+        ],
+        ids=["stable_employment", "unstable_employment"]
+    )
     @pytest.mark.asyncio
-    async def test_stable_employment(self, sample_strong_application):
-        agent = EmploymentVerificationAgent()
-        app = LoanApplicationRequest(**sample_strong_application)
-        result = await agent.process(app)
+    async def test_employment_verification(
+        self, request, employment_agent, application_fixture, expected_verified
+    ):
+        application = request.getfixturevalue(application_fixture)
+        result = await employment_agent.process(application)
         
-        # Strong employment history
-        assert result.employment_verified is True
+        assert result.employment_verified in expected_verified
         assert result.employment_stability is not None
         assert result.analysis is not None
-    
-    @pytest.mark.asyncio
-    async def test_unstable_employment(self, sample_weak_application):
-        agent = EmploymentVerificationAgent()
-        app = LoanApplicationRequest(**sample_weak_application)
-        result = await agent.process(app)
-        
-        # Weak employment history
-        assert result.employment_verified is not None
-        assert result.analysis is not None
 
 
 class TestCollateralVerificationAgent:
     """Test Collateral Verification Agent"""
     
     @pytest.mark.asyncio
-    async def test_sufficient_collateral(self, sample_strong_application):
-        agent = CollateralVerificationAgent()
-        app = LoanApplicationRequest(**sample_strong_application)
-        result = await agent.process(app)
+    async def test_sufficient_collateral(self, sample_strong_application, collateral_agent):
+        result = await collateral_agent.process(sample_strong_application)
         
         # Sufficient collateral
         assert result.collateral_sufficient is True
@@ -91,8 +83,7 @@ class TestCollateralVerificationAgent:
         assert result.analysis is not None
     
     @pytest.mark.asyncio
-    async def test_no_collateral(self):
-        agent = CollateralVerificationAgent()
+    async def test_no_collateral(self, collateral_agent):
         app_data = {
             "name": "No Collateral User",
             "income": 80000.0,
@@ -104,7 +95,7 @@ class TestCollateralVerificationAgent:
             "collateral_value": 0.0
         }
         app = LoanApplicationRequest(**app_data)
-        result = await agent.process(app)
+        result = await collateral_agent.process(app)
         
         # No collateral
         assert result.collateral_sufficient is False
@@ -115,10 +106,8 @@ class TestTestingAgent:
     """Test the Testing Agent itself"""
     
     @pytest.mark.asyncio
-    async def test_validation_pass(self):
+    async def test_validation_pass(self, testing_agent):
         """Test that testing agent validates correct decisions"""
-        agent = TestingAgent()
-        
         # Strong application should be approved
         application = {
             "income": 120000,
@@ -136,15 +125,13 @@ class TestTestingAgent:
             "agent_results": {}
         }
         
-        result = agent.analyze(application, decision_result)
+        result = testing_agent.analyze(application, decision_result)
         assert result["test_score"] >= 0.0
         assert "validation" in result
     
     @pytest.mark.asyncio
-    async def test_bias_detection(self):
+    async def test_bias_detection(self, testing_agent):
         """Test bias detection with inconsistent decisions"""
-        agent = TestingAgent()
-        
         # Two similar applications with different decisions
         test_cases = [
             {
@@ -158,17 +145,15 @@ class TestTestingAgent:
         ]
         
         for test in test_cases:
-            agent.analyze(test["application"], test["decision"])
+            testing_agent.analyze(test["application"], test["decision"])
         
-        stats = agent.get_test_statistics()
+        stats = testing_agent.get_test_statistics()
         # Should detect consistency issues
         assert stats["total_tests"] == 2
     
     @pytest.mark.asyncio
-    async def test_anomaly_detection(self):
+    async def test_anomaly_detection(self, testing_agent):
         """Test anomaly detection for suspicious patterns"""
-        agent = TestingAgent()
-        
         # High confidence approval with weak reasoning
         application = {
             "income": 30000,
@@ -186,18 +171,17 @@ class TestTestingAgent:
             "agent_results": {}
         }
         
-        result = agent.analyze(application, decision_result)
+        result = testing_agent.analyze(application, decision_result)
         assert "anomaly_detection" in result
         assert result["anomaly_detection"]["anomalies_detected"] > 0
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_statistics_generation(self):
+    async def test_statistics_generation(self, testing_agent):
         """Test statistics generation"""
-        agent = TestingAgent()
-        
         # Add some test results
-        for i in range(10):
-            application = {
+        applications = [
+            {
                 "income": 100000,
                 "loan_amount": 200000,
                 "repayment_score": 0.8,
@@ -205,38 +189,51 @@ class TestTestingAgent:
                 "employment_years": 5,
                 "name": f"Test User {i}"
             }
-            decision = {
+            for i in range(10)
+        ]
+        decisions = [
+            {
                 "final_decision": "APPROVED" if i % 2 == 0 else "REJECTED",
                 "confidence_score": 0.85,
                 "reasoning": f"Test {i}",
                 "agent_results": {}
             }
-            agent.analyze(application, decision)
+            for i in range(10)
+        ]
+        reports = testing_agent.analyze_batch(applications, decisions)
+        assert len(reports) == 10
         
-        stats = agent.get_test_statistics()
+        stats = testing_agent.get_test_statistics()
         assert stats["total_tests"] == 10
         assert "pass_rate" in stats
         assert "average_test_score" in stats
 
 
+@pytest.mark.integration
+@pytest.mark.xdist_group("integration")
 class TestAgentIntegration:
     """Test agents working together"""
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_full_agent_workflow(self, sample_strong_application):
+    async def test_full_agent_workflow(
+        self,
+        sample_strong_application,
+        greeting_agent,
+        credit_agent,
+        employment_agent,
+        collateral_agent
+    ):
         """Test all agents analyzing the same application"""
-        app = LoanApplicationRequest(**sample_strong_application)
+        app = sample_strong_application
         
-        greeting_agent = GreetingAgent()
-        credit_agent = CreditHistoryAgent()
-        employment_agent = EmploymentVerificationAgent()
-        collateral_agent = CollateralVerificationAgent()
-        
-        # Test each agent can process
-        greeting_result = await greeting_agent.process("APP-TEST-001", app.name)
-        credit_result = await credit_agent.process(app)
-        employment_result = await employment_agent.process(app)
-        collateral_result = await collateral_agent.process(app)
+        # Test each agent can process; the agents are independent
+        greeting_result, credit_result, employment_result, collateral_result = await asyncio.gather(
+            greeting_agent.process("APP-TEST-001", app.name),
+            credit_agent.process(app),
+            employment_agent.process(app),
+            collateral_agent.process(app)
+        )
         
         # All agents should return results
         assert greeting_result is not None
@@ -249,16 +246,14 @@ class TestAgentIntegration:
         assert employment_result.employment_verified is True
         assert collateral_result.collateral_sufficient is True
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_agent_consistency(self, sample_applications_batch):
+    async def test_agent_consistency(self, sample_applications_batch_models, credit_agent):
         """Test that agents are consistent across multiple applications"""
-        agent = CreditHistoryAgent()
-        
-        results = []
-        for app_data in sample_applications_batch:
-            app = LoanApplicationRequest(**app_data)
-            result = await agent.process(app)
-            results.append(result)
+        results = await asyncio.gather(
+            *(credit_agent.process(app) for app in sample_applications_batch_models)
+        )
+        assert len(results) == len(sample_applications_batch_models)
         
         # All results should have required fields
         for result in results:
@@ -11,13 +11,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from main import app
 
-client = TestClient(app)
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client whose app lifespan runs once for the whole session"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(client):
+    """OpenAPI schema, generated and fetched once per session"""
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    return response.json()
 
 
 class TestHealthEndpoint:
     """Test health check endpoint"""
     
-    def test_health_check(self):
+    def test_health_check(self, client):
         response = client.get("/health")
         assert response.status_code == 200
         
@@ -31,8 +44,8 @@ class TestLoanApplicationEndpoint:
     """Test loan application submission"""
     
     @pytest.mark.asyncio
-    async def test_successful_application(self, sample_strong_application):
-        response = client.post("/loan/apply", json=sample_strong_application)
+    async def test_successful_application(self, client, sample_strong_application_data):
+        response = client.post("/loan/apply", json=sample_strong_application_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -41,7 +54,7 @@ class TestLoanApplicationEndpoint:
         assert data["decision"] in ["Approved", "Rejected", "Conditional"]
     
     @pytest.mark.asyncio
-    async def test_missing_fields(self):
+    async def test_missing_fields(self, client):
         incomplete_app = {
             "name": "Test User",
             "income": 50000.0
@@ -55,7 +68,7 @@ class TestLoanApplicationEndpoint:
 class TestRootEndpoint:
     """Test root endpoint"""
     
-    def test_root(self):
+    def test_root(self, client):
         response = client.get("/")
         assert response.status_code == 200
         
@@ -66,15 +79,12 @@ class TestRootEndpoint:
 class TestAPIDocumentation:
     """Test API documentation endpoints"""
     
-    def test_openapi_schema(self):
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-        
-        schema = response.json()
-        assert "openapi" in schema
-        assert "paths" in schema
+    def test_openapi_schema(self, openapi_schema):
+        assert "openapi" in openapi_schema
+        assert "paths" in openapi_schema
     
-    def test_docs_endpoint(self):
+    @pytest.mark.slow
+    def test_docs_endpoint(self, client):
         response = client.get("/docs")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
@@ -0,0 +1,98 @@
+"""
+Smoke tests for the testing dashboard
+"""
+import pytest
+from orchestrator import OrchestratorAgent
+from tests import testing_dashboard
+
+
+@pytest.fixture
+def dashboard():
+    """Seeded dashboard with its own orchestrator
+
+    The dashboard runs on its own event loop, so it gets an orchestrator
+    whose semaphore is not shared with the async tests' loop.
+    """
+    dashboard = testing_dashboard.TestingDashboard()
+    dashboard.orchestrator = OrchestratorAgent()
+    dashboard.data_generator.rng.seed(1)
+    yield dashboard
+    dashboard.close()
+
+
+class TestDashboardSmoke:
+    """Run the dashboard end to end against the real orchestrator"""
+
+    def test_run_test_suite_and_display(self, dashboard, capsys):
+        dashboard.run_test_suite(test_count=10)
+
+        assert len(dashboard.test_results) == 10
+        for record in dashboard.test_results:
+            assert record["decision_result"]["final_decision"] in {"APPROVED", "REJECTED", "CONDITIONAL"}
+            assert 0.0 <= record["test_report"]["test_score"] <= 1.0
+
+        decisions = dashboard._compute_stats()["decisions"]
+        assert sum(decisions[code] for code in testing_dashboard.Decision) == 10
+
+        dashboard.display_results()
+        output = capsys.readouterr().out
+        assert "TESTING DASHBOARD - COMPREHENSIVE RESULTS" in output
+        assert "Total Tests Run:          10" in output
+
+    def test_run_test_suite_uses_process_batch(self, dashboard, capsys):
+        batch_sizes = []
+        process_batch = dashboard.orchestrator.process_batch
+
+        async def spy(applications, on_complete=None):
+            batch_sizes.append(len(applications))
+            return await process_batch(applications, on_complete)
+
+        dashboard.orchestrator.process_batch = spy
+        dashboard.run_test_suite(test_count=12)
+
+        assert batch_sizes == [12]
+        output = capsys.readouterr().out
+        assert "Processed 5/12 applications..." in output
+        assert "Processed 10/12 applications..." in output
+
+    def test_identical_applications_decided_once(self, dashboard):
+        batch_sizes = []
+        process_batch = dashboard.orchestrator.process_batch
+
+        async def spy(applications, on_complete=None):
+            batch_sizes.append(len(applications))
+            return await process_batch(applications, on_complete)
+
+        dashboard.orchestrator.process_batch = spy
+        app_data = dashboard.data_generator.generate_application("strong")
+        first, second = dashboard._decide_cached([app_data, dict(app_data)])
+
+        assert batch_sizes == [1]
+        assert first is second
+
+    def test_stress_test_counts_every_application(self, dashboard, capsys):
+        dashboard.run_stress_test(count=10)
+
+        output = capsys.readouterr().out
+        assert "Successful:                10" in output
+        assert "Errors:                    0" in output
+
+    def test_stress_test_counts_invalid_application_as_error(self, dashboard, capsys):
+        generator = dashboard.data_generator
+        batch = generator.generate_stress_test_batch(9) + [generator._edge_zero_income()]
+        generator.generate_stress_test_batch = lambda count: batch
+        dashboard.run_stress_test(count=10)
+
+        output = capsys.readouterr().out
+        assert "ERROR on application 10:" in output
+        assert "Successful:                9" in output
+        assert "Errors:                    1" in output
+
+    def test_run_test_suite_skips_invalid_application(self, dashboard, capsys):
+        generator = dashboard.data_generator
+        batch = generator.generate_batch(5) + [generator._edge_zero_income()]
+        generator.generate_batch = lambda count, profile_distribution: batch
+        dashboard.run_test_suite(test_count=6)
+
+        assert len(dashboard.test_results) == 5
+        assert "Skipped 1 applications that fail request validation" in capsys.readouterr().out
@@ -0,0 +1,65 @@
+"""
+Unit tests for the test data generator
+"""
+import pytest
+from tests.test_data_generator import TestDataGenerator as DataGenerator
+
+
+class TestSeeding:
+    """Test reproducibility of seeded generators"""
+
+    @pytest.mark.parametrize("seed", [0, 42])
+    def test_same_seed_same_batch(self, seed):
+        first = DataGenerator(seed=seed).generate_batch(count=20)
+        second = DataGenerator(seed=seed).generate_batch(count=20)
+
+        assert first == second
+
+    def test_different_seeds_differ(self):
+        assert DataGenerator(seed=0).generate_batch(count=20) != DataGenerator(seed=1).generate_batch(count=20)
+
+
+class TestProfileRanges:
+    """Test generated values against PROFILE_RANGES"""
+
+    @pytest.mark.parametrize("profile_type", list(DataGenerator.PROFILE_RANGES))
+    def test_values_within_ranges(self, profile_type):
+        generator = DataGenerator(seed=7)
+        ranges = DataGenerator.PROFILE_RANGES[profile_type]
+        applications = [generator.generate_application(profile_type) for _ in range(300)]
+
+        for app in applications:
+            for field, (low, high) in ranges.items():
+                if field == "loan_to_income":
+                    assert low <= app["loan_amount"] / app["income"] <= high
+                else:
+                    assert low <= app[field] <= high, field
+            assert isinstance(app["existing_loans"], int)
+
+        # Integer ranges include both ends
+        loans_low, loans_high = ranges["existing_loans"]
+        assert {app["existing_loans"] for app in applications} == set(range(loans_low, loans_high + 1))
+
+    def test_integer_spans_count_both_ends(self):
+        spans = DataGenerator.PROFILE_SPANS["strong"]
+
+        assert spans["existing_loans"] == (0, 3)
+        assert spans["income"] == (90000.0, 90000.0)
+
+
+class TestBatchColumns:
+    """Test column-form batch generation"""
+
+    @pytest.mark.parametrize(
+        "profile_distribution",
+        [None, {"edge_case": 0.5, "weak": 0.5}],
+        ids=["default", "edge_cases"]
+    )
+    def test_columns_match_rows(self, profile_distribution):
+        rows = DataGenerator(seed=3).generate_batch(25, profile_distribution)
+        columns = DataGenerator(seed=3).generate_batch_columns(25, profile_distribution)
+
+        assert set(columns) == set(rows[0])
+        for field, column in columns.items():
+            assert len(column) == 25
+            assert list(column) == [row[field] for row in rows], field
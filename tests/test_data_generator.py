@@ -2,18 +2,72 @@
 Test Data Generator
 Generates diverse test data for comprehensive testing
 """
+import json
 import random
-from typing import List, Dict, Any
+from array import array
+from functools import partial
+from typing import Callable, List, Dict, Any, Sequence
 from datetime import datetime
 
 
 class TestDataGenerator:
     """Generate diverse loan application test data"""
     
+    # (low, high) sampling range per field for each regular profile type;
+    # "loan_to_income" draws the loan amount as a multiple of the income
+    PROFILE_RANGES = {
+        # High approval probability
+        "strong": {
+            "income": (90000.0, 180000.0),
+            "loan_amount": (100000.0, 300000.0),
+            "existing_loans": (0, 2),
+            "repayment_score": (0.85, 0.98),
+            "employment_years": (5.0, 20.0),
+            "collateral_value": (200000.0, 500000.0)
+        },
+        # High rejection probability (high DTI)
+        "weak": {
+            "income": (25000.0, 45000.0),
+            "loan_to_income": (4.0, 8.0),
+            "existing_loans": (3, 6),
+            "repayment_score": (0.30, 0.55),
+            "employment_years": (0.5, 2.5),
+            "collateral_value": (30000.0, 80000.0)
+        },
+        # Conditional/mixed
+        "moderate": {
+            "income": (50000.0, 85000.0),
+            "loan_to_income": (2.0, 3.5),
+            "existing_loans": (1, 3),
+            "repayment_score": (0.65, 0.80),
+            "employment_years": (2.5, 7.0),
+            "collateral_value": (100000.0, 250000.0)
+        },
+        # Completely random
+        "random": {
+            "income": (25000.0, 200000.0),
+            "loan_amount": (50000.0, 500000.0),
+            "existing_loans": (0, 6),
+            "repayment_score": (0.30, 0.98),
+            "employment_years": (0.5, 25.0),
+            "collateral_value": (0.0, 600000.0)
+        }
+    }
+    
+    # PROFILE_RANGES as (low, width) pairs; integer widths count both ends
+    PROFILE_SPANS = {
+        profile_type: {
+            field: (low, high - low + (isinstance(low, int) and isinstance(high, int)))
+            for field, (low, high) in ranges.items()
+        }
+        for profile_type, ranges in PROFILE_RANGES.items()
+    }
+    
     def __init__(self, seed: int = None):
         """Initialize generator with optional seed for reproducibility"""
-        if seed:
-            random.seed(seed)
+        # Private random source so seeding does not touch the global state;
+        # any seed other than None (including 0) makes output reproducible
+        self.rng = random.Random(seed)
         
         self.company_names = [
             "Tech Corp", "Finance Inc", "Retail Solutions", "Manufacturing Co",
@@ -34,6 +88,19 @@ class TestDataGenerator:
             "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez",
             "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin"
         ]
+        
+        # Every full name, built once so each application needs a single draw
+        self.name_pool = [f"{first} {last}" for first in self.first_names for last in self.last_names]
+        
+        # Edge case generators, picked by index
+        self._edge_case_generators = [
+            self._edge_zero_income,
+            self._edge_extreme_dti,
+            self._edge_perfect_score,
+            self._edge_zero_collateral,
+            self._edge_maximum_loans,
+            self._edge_minimal_employment
+        ]
     
     def generate_application(self, profile_type: str = "random") -> Dict[str, Any]:
         """
@@ -50,16 +117,15 @@ class TestDataGenerator:
         Returns:
             Dictionary with loan application data
         """
-        if profile_type == "strong":
-            return self._generate_strong_profile()
-        elif profile_type == "weak":
-            return self._generate_weak_profile()
-        elif profile_type == "moderate":
-            return self._generate_moderate_profile()
-        elif profile_type == "edge_case":
-            return self._generate_edge_case_profile()
-        else:
-            return self._generate_random_profile()
+        return self._profile_generator(profile_type)()
+    
+    def _profile_generator(self, profile_type: str) -> Callable[[], Dict[str, Any]]:
+        """Resolve a profile type to the function that generates it"""
+        if profile_type == "edge_case":
+            return self._generate_edge_case_profile
+        
+        spans = self.PROFILE_SPANS.get(profile_type, self.PROFILE_SPANS["random"])
+        return partial(self._generate_from_ranges, spans)
     
     def generate_batch(self, count: int = 10, 
                       profile_distribution: Dict[str, float] = None) -> List[Dict[str, Any]]:
@@ -74,6 +140,19 @@ class TestDataGenerator:
         Returns:
             List of loan application dictionaries
         """
+        return [generate() for generate in self._draw_profile_generators(count, profile_distribution)]
+    
+    def _draw_profile_generators(self, count: int,
+                                 profile_distribution: Dict[str, float] = None,
+                                 resolve: Callable[[str], Callable] = None) -> List[Callable]:
+        """Draw the profile generator of every application in a batch
+        
+        resolve maps a profile type to its generator and defaults to
+        _profile_generator.
+        """
+        if resolve is None:
+            resolve = self._profile_generator
+        
         if profile_distribution is None:
             # Default distribution
             profile_distribution = {
@@ -83,171 +162,217 @@ class TestDataGenerator:
                 "edge_case": 0.05
             }
         
-        # Normalize distribution
-        total = sum(profile_distribution.values())
-        normalized = {k: v/total for k, v in profile_distribution.items()}
+        # Resolve each profile type once, then draw generators for the whole
+        # batch in one weighted sample (weights need not sum to 1)
+        return self.rng.choices(
+            [resolve(profile_type) for profile_type in profile_distribution],
+            weights=list(profile_distribution.values()),
+            k=count
+        )
+    
+    def generate_batch_columns(self, count: int = 10,
+                               profile_distribution: Dict[str, float] = None) -> Dict[str, Sequence]:
+        """
+        Generate a batch of loan applications in column form
         
-        applications = []
-        for _ in range(count):
-            # Choose profile type based on distribution
-            rand = random.random()
-            cumulative = 0.0
-            profile_type = "random"
-            
-            for ptype, prob in normalized.items():
-                cumulative += prob
-                if rand <= cumulative:
-                    profile_type = ptype
-                    break
-            
-            applications.append(self.generate_application(profile_type))
+        Numeric fields are packed into typed arrays, so large batches hold one
+        contiguous buffer per field instead of a dictionary per application.
         
-        return applications
+        Args:
+            count: Number of applications to generate
+            profile_distribution: Distribution of profile types (see generate_batch)
+        
+        Returns:
+            Dictionary mapping each field name to its column of values
+        """
+        columns = {
+            "name": [],
+            "income": array("d"),
+            "loan_amount": array("d"),
+            "existing_loans": array("q"),
+            "repayment_score": array("d"),
+            "employment_years": array("d"),
+            "company_name": [],
+            "collateral_value": array("d")
+        }
+        
+        # Each drawn filler appends one application straight into the columns
+        appenders = {field: column.append for field, column in columns.items()}
+        for fill in self._draw_profile_generators(
+            count,
+            profile_distribution,
+            partial(self._column_filler, appenders=appenders)
+        ):
+            fill()
+        
+        return columns
     
-    def _generate_strong_profile(self) -> Dict[str, Any]:
-        """Generate a strong applicant profile (likely approval)"""
+    def _column_filler(self, profile_type: str,
+                       appenders: Dict[str, Callable]) -> Callable[[], None]:
+        """Resolve a profile type to a function appending one application to columns"""
+        if profile_type == "edge_case":
+            return partial(self._fill_edge_case, appenders)
+        
+        spans = self.PROFILE_SPANS.get(profile_type, self.PROFILE_SPANS["random"])
+        return partial(self._fill_from_ranges, spans, appenders)
+    
+    def _fill_edge_case(self, appenders: Dict[str, Callable]):
+        """Append an edge case profile to the columns"""
+        # Edge cases are rare, so they reuse the dictionary generators
+        for field, value in self._generate_edge_case_profile().items():
+            appenders[field](value)
+    
+    def _generate_from_ranges(self, spans: Dict[str, tuple]) -> Dict[str, Any]:
+        """Generate an applicant profile from a PROFILE_SPANS entry"""
+        # uniform/randint/choice inlined as arithmetic on one cached random()
+        r = self.rng.random
+        names = self.name_pool
+        companies = self.company_names
+        
+        low, span = spans["income"]
+        income = low + span * r()
+        if "loan_to_income" in spans:
+            low, span = spans["loan_to_income"]
+            loan_amount = income * (low + span * r())
+        else:
+            low, span = spans["loan_amount"]
+            loan_amount = low + span * r()
+        
+        loans_low, loans_span = spans["existing_loans"]
+        score_low, score_span = spans["repayment_score"]
+        years_low, years_span = spans["employment_years"]
+        collateral_low, collateral_span = spans["collateral_value"]
+        
+        return {
+            "name": names[int(len(names) * r())],
+            "income": income,
+            "loan_amount": loan_amount,
+            "existing_loans": loans_low + int(loans_span * r()),
+            "repayment_score": score_low + score_span * r(),
+            "employment_years": years_low + years_span * r(),
+            "company_name": companies[int(len(companies) * r())],
+            "collateral_value": collateral_low + collateral_span * r()
+        }
+    
+    def _fill_from_ranges(self, spans: Dict[str, tuple], appenders: Dict[str, Callable]):
+        """Append a PROFILE_SPANS profile to the columns
+        
+        Draws in the same order as _generate_from_ranges, so a seeded batch
+        has the same values in column and row form.
+        """
+        r = self.rng.random
+        names = self.name_pool
+        companies = self.company_names
+        
+        low, span = spans["income"]
+        income = low + span * r()
+        if "loan_to_income" in spans:
+            low, span = spans["loan_to_income"]
+            loan_amount = income * (low + span * r())
+        else:
+            low, span = spans["loan_amount"]
+            loan_amount = low + span * r()
+        
+        loans_low, loans_span = spans["existing_loans"]
+        score_low, score_span = spans["repayment_score"]
+        years_low, years_span = spans["employment_years"]
+        collateral_low, collateral_span = spans["collateral_value"]
+        
+        appenders["name"](names[int(len(names) * r())])
+        appenders["income"](income)
+        appenders["loan_amount"](loan_amount)
+        appenders["existing_loans"](loans_low + int(loans_span * r()))
+        appenders["repayment_score"](score_low + score_span * r())
+        appenders["employment_years"](years_low + years_span * r())
+        appenders["company_name"](companies[int(len(companies) * r())])
+        appenders["collateral_value"](collateral_low + collateral_span * r())
+    
+    def _generate_edge_case_profile(self) -> Dict[str, Any]:
+        """Generate edge case profiles for testing boundaries"""
+        return self._edge_case_generators[self.rng.randrange(len(self._edge_case_generators))]()
+    
+    def _edge_zero_income(self) -> Dict[str, Any]:
+        """Edge case: applicant with no income"""
         return {
             "name": self._generate_name(),
-            "income": random.uniform(90000, 180000),
-            "loan_amount": random.uniform(100000, 300000),
-            "existing_loans": random.randint(0, 2),
-            "repayment_score": random.uniform(0.85, 0.98),
-            "employment_years": random.uniform(5.0, 20.0),
-            "company_name": random.choice(self.company_names),
-            "collateral_value": random.uniform(200000, 500000)
+            "income": 0.0,
+            "loan_amount": 100000.0,
+            "existing_loans": 0,
+            "repayment_score": 0.80,
+            "employment_years": 1.0,
+            "company_name": self.rng.choice(self.company_names),
+            "collateral_value": 150000.0
         }
     
-    def _generate_weak_profile(self) -> Dict[str, Any]:
-        """Generate a weak applicant profile (likely rejection)"""
-        income = random.uniform(25000, 45000)
+    def _edge_extreme_dti(self) -> Dict[str, Any]:
+        """Edge case: loan amount 10-20x income"""
+        income = self.rng.uniform(30000, 50000)
         return {
             "name": self._generate_name(),
             "income": income,
-            "loan_amount": random.uniform(income * 4, income * 8),  # High DTI
-            "existing_loans": random.randint(3, 6),
-            "repayment_score": random.uniform(0.30, 0.55),
-            "employment_years": random.uniform(0.5, 2.5),
-            "company_name": random.choice(self.company_names),
-            "collateral_value": random.uniform(30000, 80000)
+            "loan_amount": income * self.rng.uniform(10, 20),  # Extreme DTI
+            "existing_loans": self.rng.randint(2, 4),
+            "repayment_score": self.rng.uniform(0.60, 0.75),
+            "employment_years": self.rng.uniform(2.0, 5.0),
+            "company_name": self.rng.choice(self.company_names),
+            "collateral_value": self.rng.uniform(50000, 100000)
         }
     
-    def _generate_moderate_profile(self) -> Dict[str, Any]:
-        """Generate a moderate applicant profile (conditional/mixed)"""
-        income = random.uniform(50000, 85000)
+    def _edge_perfect_score(self) -> Dict[str, Any]:
+        """Edge case: perfect repayment score and finances"""
         return {
             "name": self._generate_name(),
-            "income": income,
-            "loan_amount": random.uniform(income * 2, income * 3.5),
-            "existing_loans": random.randint(1, 3),
-            "repayment_score": random.uniform(0.65, 0.80),
-            "employment_years": random.uniform(2.5, 7.0),
-            "company_name": random.choice(self.company_names),
-            "collateral_value": random.uniform(100000, 250000)
+            "income": 200000.0,
+            "loan_amount": 150000.0,
+            "existing_loans": 0,
+            "repayment_score": 1.0,  # Perfect score
+            "employment_years": 15.0,
+            "company_name": self.rng.choice(self.company_names),
+            "collateral_value": 500000.0
         }
     
-    def _generate_random_profile(self) -> Dict[str, Any]:
-        """Generate a completely random profile"""
-        income = random.uniform(25000, 200000)
+    def _edge_zero_collateral(self) -> Dict[str, Any]:
+        """Edge case: no collateral offered"""
         return {
             "name": self._generate_name(),
-            "income": income,
-            "loan_amount": random.uniform(50000, 500000),
-            "existing_loans": random.randint(0, 6),
-            "repayment_score": random.uniform(0.30, 0.98),
-            "employment_years": random.uniform(0.5, 25.0),
-            "company_name": random.choice(self.company_names),
-            "collateral_value": random.uniform(0, 600000)
+            "income": self.rng.uniform(60000, 90000),
+            "loan_amount": self.rng.uniform(150000, 250000),
+            "existing_loans": self.rng.randint(1, 2),
+            "repayment_score": self.rng.uniform(0.70, 0.85),
+            "employment_years": self.rng.uniform(3.0, 8.0),
+            "company_name": self.rng.choice(self.company_names),
+            "collateral_value": 0.0  # No collateral
         }
     
-    def _generate_edge_case_profile(self) -> Dict[str, Any]:
-        """Generate edge case profiles for testing boundaries"""
-        edge_type = random.choice([
-            "zero_income",
-            "extreme_dti",
-            "perfect_score",
-            "zero_collateral",
-            "maximum_loans",
-            "minimal_employment"
-        ])
-        
-        if edge_type == "zero_income":
-            return {
-                "name": self._generate_name(),
-                "income": 0.0,
-                "loan_amount": 100000.0,
-                "existing_loans": 0,
-                "repayment_score": 0.80,
-                "employment_years": 1.0,
-                "company_name": random.choice(self.company_names),
-                "collateral_value": 150000.0
-            }
-        
-        elif edge_type == "extreme_dti":
-            income = random.uniform(30000, 50000)
-            return {
-                "name": self._generate_name(),
-                "income": income,
-                "loan_amount": income * random.uniform(10, 20),  # Extreme DTI
-                "existing_loans": random.randint(2, 4),
-                "repayment_score": random.uniform(0.60, 0.75),
-                "employment_years": random.uniform(2.0, 5.0),
-                "company_name": random.choice(self.company_names),
-                "collateral_value": random.uniform(50000, 100000)
-            }
-        
-        elif edge_type == "perfect_score":
-            return {
-                "name": self._generate_name(),
-                "income": 200000.0,
-                "loan_amount": 150000.0,
-                "existing_loans": 0,
-                "repayment_score": 1.0,  # Perfect score
-                "employment_years": 15.0,
-                "company_name": random.choice(self.company_names),
-                "collateral_value": 500000.0
-            }
-        
-        elif edge_type == "zero_collateral":
-            return {
-                "name": self._generate_name(),
-                "income": random.uniform(60000, 90000),
-                "loan_amount": random.uniform(150000, 250000),
-                "existing_loans": random.randint(1, 2),
-                "repayment_score": random.uniform(0.70, 0.85),
-                "employment_years": random.uniform(3.0, 8.0),
-                "company_name": random.choice(self.company_names),
-                "collateral_value": 0.0  # No collateral
-            }
-        
-        elif edge_type == "maximum_loans":
-            return {
-                "name": self._generate_name(),
-                "income": random.uniform(70000, 100000),
-                "loan_amount": random.uniform(100000, 200000),
-                "existing_loans": 10,  # Many existing loans
-                "repayment_score": random.uniform(0.60, 0.75),
-                "employment_years": random.uniform(5.0, 10.0),
-                "company_name": random.choice(self.company_names),
-                "collateral_value": random.uniform(150000, 250000)
-            }
-        
-        else:  # minimal_employment
-            return {
-                "name": self._generate_name(),
-                "income": random.uniform(40000, 70000),
-                "loan_amount": random.uniform(100000, 180000),
-                "existing_loans": random.randint(1, 3),
-                "repayment_score": random.uniform(0.65, 0.80),
-                "employment_years": 0.1,  # Just started
-                "company_name": random.choice(self.company_names),
-                "collateral_value": random.uniform(120000, 200000)
-            }
+    def _edge_maximum_loans(self) -> Dict[str, Any]:
+        """Edge case: many existing loans"""
+        return {
+            "name": self._generate_name(),
+            "income": self.rng.uniform(70000, 100000),
+            "loan_amount": self.rng.uniform(100000, 200000),
+            "existing_loans": 10,  # Many existing loans
+            "repayment_score": self.rng.uniform(0.60, 0.75),
+            "employment_years": self.rng.uniform(5.0, 10.0),
+            "company_name": self.rng.choice(self.company_names),
+            "collateral_value": self.rng.uniform(150000, 250000)
+        }
+    
+    def _edge_minimal_employment(self) -> Dict[str, Any]:
+        """Edge case: just started employment"""
+        return {
+            "name": self._generate_name(),
+            "income": self.rng.uniform(40000, 70000),
+            "loan_amount": self.rng.uniform(100000, 180000),
+            "existing_loans": self.rng.randint(1, 3),
+            "repayment_score": self.rng.uniform(0.65, 0.80),
+            "employment_years": 0.1,  # Just started
+            "company_name": self.rng.choice(self.company_names),
+            "collateral_value": self.rng.uniform(120000, 200000)
+        }
     
     def _generate_name(self) -> str:
         """Generate a random name"""
-        first = random.choice(self.first_names)
-        last = random.choice(self.last_names)
-        return f"{first} {last}"
+        return self.rng.choice(self.name_pool)
     
     def generate_stress_test_batch(self, count: int = 100) -> List[Dict[str, Any]]:
         """Generate a large batch for stress testing"""
@@ -268,40 +393,41 @@ class TestDataGenerator:
         
         for _ in range(5):
             # Generate base profile
-            base_income = random.uniform(50000, 100000)
-            base_loan = base_income * random.uniform(2.0, 3.5)
-            base_repayment = random.uniform(0.70, 0.85)
+            base_income = self.rng.uniform(50000, 100000)
+            base_loan = base_income * self.rng.uniform(2.0, 3.5)
+            base_repayment = self.rng.uniform(0.70, 0.85)
             
             # Create two nearly identical applications
             for i in range(2):
                 applications.append({
                     "name": self._generate_name(),
-                    "income": base_income * random.uniform(0.95, 1.05),  # Within 5%
-                    "loan_amount": base_loan * random.uniform(0.95, 1.05),
-                    "existing_loans": random.randint(1, 3),
-                    "repayment_score": base_repayment * random.uniform(0.97, 1.03),
-                    "employment_years": random.uniform(3.0, 7.0),
-                    "company_name": random.choice(self.company_names),
-                    "collateral_value": base_loan * random.uniform(1.1, 1.4)
+                    "income": base_income * self.rng.uniform(0.95, 1.05),  # Within 5%
+                    "loan_amount": base_loan * self.rng.uniform(0.95, 1.05),
+                    "existing_loans": self.rng.randint(1, 3),
+                    "repayment_score": base_repayment * self.rng.uniform(0.97, 1.03),
+                    "employment_years": self.rng.uniform(3.0, 7.0),
+                    "company_name": self.rng.choice(self.company_names),
+                    "collateral_value": base_loan * self.rng.uniform(1.1, 1.4)
                 })
         
         return applications
     
-    def save_to_file(self, applications: List[Dict[str, Any]], filename: str):
-        """Save generated applications to JSON file"""
-        import json
+    def save_to_file(self, applications: List[Dict[str, Any]], filename: str, pretty: bool = False):
+        """Save generated applications to JSON file (compact unless pretty is set)"""
+        if pretty:
+            content = json.dumps(applications, indent=2)
+        else:
+            content = json.dumps(applications, separators=(",", ":"))
         
         with open(filename, 'w') as f:
-            json.dump(applications, f, indent=2)
+            f.write(content)
         
         print(f"Saved {len(applications)} applications to {filename}")
     
     def load_from_file(self, filename: str) -> List[Dict[str, Any]]:
         """Load applications from JSON file"""
-        import json
-        
         with open(filename, 'r') as f:
-            applications = json.load(f)
+            applications = json.loads(f.read())
         
         print(f"Loaded {len(applications)} applications from {filename}")
         return applications
@@ -317,6 +443,7 @@ if __name__ == "__main__":
                        default="random", help="Type of test data")
     parser.add_argument("--output", type=str, help="Output file (JSON)")
     parser.add_argument("--seed", type=int, help="Random seed for reproducibility")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output")
     
     args = parser.parse_args()
     
@@ -330,7 +457,6 @@ if __name__ == "__main__":
         applications = generator.generate_batch(count=args.count)
     
     if args.output:
-        generator.save_to_file(applications, args.output)
+        generator.save_to_file(applications, args.output, pretty=args.pretty)
     else:
-        import json
         print(json.dumps(applications, indent=2))
@@ -0,0 +1,177 @@
+"""
+Unit tests for the orchestrator workflow
+"""
+import asyncio
+import pytest
+from agents import TransientAgentError
+from orchestrator import orchestrator, _retry, _APP_ID
+from database import db
+
+
+class TestWorkflowResume:
+    """Test per-stage persistence and resume"""
+
+    @pytest.mark.asyncio
+    async def test_stage_state_cleared_after_final_decision(self, sample_strong_application):
+        result = await orchestrator.process_application(sample_strong_application)
+        await orchestrator.wait_for_pending()
+
+        assert db.load_state(result.application_id) == {}
+        assert db.get_application(result.application_id)["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_stages(self, sample_strong_application):
+        application_id = orchestrator.generate_application_id()
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("stage failed")
+
+        # Interrupt the first run at the critique stage
+        original_critique = orchestrator.critique_agent.process
+        orchestrator.critique_agent.process = fail
+        try:
+            with pytest.raises(Exception):
+                await orchestrator.process_application(
+                    sample_strong_application,
+                    application_id=application_id
+                )
+        finally:
+            orchestrator.critique_agent.process = original_critique
+
+        state = db.load_state(application_id)
+        assert "credit_history_agent" in state
+        assert "critique_agent" not in state
+        # Greeting is always re-run, so it is never persisted
+        assert "greeting_agent" not in state
+
+        original_credit = orchestrator.credit_history_agent.process
+        orchestrator.credit_history_agent.process = fail
+        try:
+            resumed = await orchestrator.process_application(
+                sample_strong_application,
+                application_id=application_id
+            )
+        finally:
+            orchestrator.credit_history_agent.process = original_credit
+
+        assert resumed.application_id == application_id
+        assert resumed.agent_summary["credit_history"]["credit_score"] == (
+            state["credit_history_agent"]["credit_score"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_resume_rejects_different_application(
+        self, sample_strong_application, sample_weak_application
+    ):
+        first = await orchestrator.process_application(sample_strong_application)
+
+        with pytest.raises(ValueError):
+            await orchestrator.process_application(
+                sample_weak_application,
+                application_id=first.application_id
+            )
+
+
+class TestBatchProcessing:
+    """Test processing several applications at once"""
+
+    @pytest.mark.asyncio
+    async def test_process_batch_preserves_order(
+        self, sample_strong_application, sample_weak_application
+    ):
+        applications = [sample_strong_application, sample_weak_application]
+        results = await orchestrator.process_batch(applications)
+
+        assert len(results) == 2
+        assert len({result.application_id for result in results}) == 2
+        assert results[0].risk_score < results[1].risk_score
+
+    @pytest.mark.asyncio
+    async def test_process_batch_reports_each_completion(
+        self, sample_strong_application, sample_weak_application
+    ):
+        completed = []
+        await orchestrator.process_batch(
+            [sample_strong_application, sample_weak_application],
+            on_complete=completed.append
+        )
+
+        assert sorted(completed) == [0, 1]
+
+
+class TestBackgroundFinalize:
+    """Test final decision persistence after the response is returned"""
+
+    @pytest.mark.asyncio
+    async def test_final_decision_saved(self, sample_strong_application):
+        result = await orchestrator.process_application(sample_strong_application)
+        await orchestrator.wait_for_pending()
+
+        status = orchestrator.get_application_status(result.application_id)
+        assert status["status"] == "completed"
+        assert status["final_decision"]["decision"] == result.decision
+
+
+class TestLogContext:
+    """Test the application ID bound to orchestrator logs"""
+
+    @pytest.mark.asyncio
+    async def test_application_id_reset_after_processing(self, sample_strong_application):
+        await orchestrator.process_application(sample_strong_application)
+
+        assert _APP_ID.get() == "-"
+
+
+class TestAgentRetry:
+    """Test timeout and retry around agent calls"""
+
+    @pytest.mark.asyncio
+    async def test_transient_error_retried(self):
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise TransientAgentError("temporary failure")
+            return "ok"
+
+        result = await _retry(flaky, retries=3, base_backoff=0, timeout=1)
+        assert result == "ok"
+        assert len(attempts) == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_exhausts_retries(self):
+        async def hang():
+            await asyncio.sleep(1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await _retry(hang, retries=1, base_backoff=0, timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_other_errors_not_retried(self):
+        attempts = []
+
+        async def broken():
+            attempts.append(1)
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            await _retry(broken, retries=3, base_backoff=0, timeout=1)
+        assert len(attempts) == 1
+
+    @pytest.mark.asyncio
+    async def test_gate_wait_not_counted_against_timeout(self):
+        gate = asyncio.Semaphore(1)
+        attempts = []
+
+        async def slow():
+            attempts.append(1)
+            await asyncio.sleep(0.15)
+            return "ok"
+
+        # Queued calls wait past the timeout for the slot but are not retried
+        results = await asyncio.gather(
+            *(_retry(slow, retries=2, base_backoff=0, timeout=0.25, gate=gate) for _ in range(3))
+        )
+        assert results == ["ok"] * 3
+        assert len(attempts) == 3
@@ -0,0 +1,68 @@
+"""
+Unit tests for the precompiled prompt formatters
+"""
+from string import Formatter
+
+import pytest
+
+import prompts
+from prompts.templating import compile_template
+
+
+# (formatters, source messages) for every *_FORMATTERS dictionary
+FORMATTER_SOURCES = [
+    ("GREETING_FORMATTERS", "GREETING_TEMPLATES"),
+    ("CREDIT_ANALYSIS_FORMATTERS", "CREDIT_ANALYSIS_MESSAGES"),
+    ("EMPLOYMENT_FORMATTERS", "EMPLOYMENT_MESSAGES"),
+    ("COLLATERAL_FORMATTERS", "COLLATERAL_MESSAGES"),
+    ("CRITIQUE_FORMATTERS", "CRITIQUE_MESSAGES"),
+    ("DECISION_FORMATTERS", "DECISION_REASONING"),
+    ("PLANNER_FORMATTERS", "PLANNER_MESSAGES")
+]
+
+
+def sample_fields(template: str) -> dict:
+    """Sample keyword arguments for every field of a template"""
+    return {
+        field_name: 1234.5678 if format_spec else f"<{field_name}>"
+        for _, field_name, format_spec, _ in Formatter().parse(template)
+        if field_name is not None
+    }
+
+
+class TestMessageFormatters:
+    """Test that every compiled formatter matches str.format"""
+
+    @pytest.mark.parametrize("formatters_name, messages_name", FORMATTER_SOURCES)
+    def test_formatters_match_format(self, formatters_name, messages_name):
+        formatters = getattr(prompts, formatters_name)
+        messages = getattr(prompts, messages_name)
+
+        templates = {key: value for key, value in messages.items() if isinstance(value, str)}
+        assert formatters.keys() == templates.keys()
+
+        for key, template in templates.items():
+            kwargs = sample_fields(template)
+            assert formatters[key](**kwargs) == template.format(**kwargs), key
+
+
+class TestCompileTemplate:
+    """Test the template compiler on edge-case field names"""
+
+    @pytest.mark.parametrize(
+        "template, kwargs",
+        [
+            ("Score {format:.2f} for {str!s}", {"format": 1.5, "str": "x"}),
+            ("{repr!r} and {ascii!a}", {"repr": "q", "ascii": "é"}),
+            ("Catch-all {_}", {"_": 3}),
+            ("Keyword {class}", {"class": "A"}),
+            ("Percent 100% of {value:.0%}", {"value": 0.5}),
+            ("No fields, {{braces}} kept", {})
+        ],
+        ids=["builtin_names", "conversions", "underscore", "keyword", "percent_literal", "no_fields"]
+    )
+    def test_matches_format(self, template, kwargs):
+        assert compile_template(template)(**kwargs) == template.format(**kwargs)
+
+    def test_extra_keywords_ignored(self):
+        assert compile_template("Hi {name}")(name="Ann", unused=1) == "Hi Ann"
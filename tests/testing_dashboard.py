@@ -2,27 +2,312 @@
 Testing Dashboard
 Interactive dashboard for viewing test results and system health
 """
+import asyncio
 import sys
+import threading
+import time
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from enum import IntEnum
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict
-import json
+from queue import SimpleQueue
+from typing import (
+    Any, Awaitable, Callable, Hashable, Iterator, List, Dict, Optional, Sequence, TextIO, Tuple
+)
+
+from pydantic import ValidationError
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agents.testing_agent import TestingAgent
-from tests.test_data_generator import TestDataGenerator
-from orchestrator import LoanOrchestrator
-from models import LoanApplication
+from models import LoanApplicationRequest, LoanApplicationResponse
+
+# Decisions kept per distinct application; calls faster than the threshold
+# are not worth caching
+DECISION_CACHE_SIZE = 4096
+DECISION_CACHE_MIN_NS = 500_000
+
+# Fields of every application TestDataGenerator emits, in fingerprint order
+_KEY_FIELDS = (
+    "name", "income", "loan_amount", "existing_loans", "repayment_score",
+    "employment_years", "company_name", "collateral_value"
+)
+_KEY_FIELD_SET = frozenset(_KEY_FIELDS)
+
+
+class Decision(IntEnum):
+    """Final decision codes stored in the dashboard's decision column"""
+    APPROVED = 0
+    REJECTED = 1
+    CONDITIONAL = 2
+
+
+# Decision names to codes; anything else is kept as -1 so it is counted
+# under none of them
+_DECISION_CODES = {code.name: code.value for code in Decision}
+_UNKNOWN_DECISION = -1
+
+# Anomaly risk levels reported in the dashboard's high-risk section
+_HIGH_RISK_LEVELS = frozenset({"HIGH", "CRITICAL"})
+
+
+def _fingerprint(app_data: Dict) -> Hashable:
+    """Hashable key identifying an application's contents"""
+    if app_data.keys() == _KEY_FIELD_SET:
+        # Generator schema: values in fixed field order
+        return tuple(map(app_data.__getitem__, _KEY_FIELDS))
+    return tuple(sorted(app_data.items()))
+
+
+def _to_decision_result(response: LoanApplicationResponse) -> Dict[str, Any]:
+    """
+    Flatten an orchestrator response into the dict TestingAgent.analyze reads
+    
+    Args:
+        response: Orchestrator response for one application
+        
+    Returns:
+        Dictionary with final_decision, confidence_score, reasoning and agent_results
+    """
+    summary = response.agent_summary
+    # The critique confidence is the only confidence the workflow reports
+    confidence = summary["critique"]["confidence_score"]
+    return {
+        "application_id": response.application_id,
+        "final_decision": response.decision.upper(),
+        "confidence_score": confidence,
+        "risk_score": response.risk_score,
+        "reasoning": response.reasoning,
+        "agent_results": {
+            agent: {
+                "decision": "APPROVED" if summary[agent]["passed"] else "REJECTED",
+                "confidence": confidence
+            }
+            for agent in ("credit_history", "employment", "collateral")
+        }
+    }
+
+
+def _drain(queue: SimpleQueue, stream: TextIO):
+    """Write queued progress messages until a None sentinel arrives"""
+    while True:
+        message = queue.get()
+        if message is None:
+            break
+        stream.write(message)
+        stream.flush()
+
+
+@contextmanager
+def _progress_writer() -> Iterator[Callable[[str], None]]:
+    """Yield a non-blocking emit(line); lines are written by a background thread before exit"""
+    queue: SimpleQueue = SimpleQueue()
+    writer = threading.Thread(target=_drain, args=(queue, sys.stdout), daemon=True)
+    writer.start()
+    try:
+        yield lambda line: queue.put_nowait(line + "\n")
+    finally:
+        queue.put(None)
+        writer.join()
 
 
 class TestingDashboard:
     """Interactive testing dashboard for monitoring system quality"""
     
+    # Dashboard layout pieces, built once at class creation
+    _RULE = "=" * 70
+    _THIN_RULE = "─" * 70
+    _SECTION_TMPL = "{:<50}"
+    _ROW_TMPL = "  {:<26}{}"
+    _COUNT_ROW_TMPL = "  {:<26}{} ({:.1f}%)"
+    # Fairness and stress summaries align their values one column further
+    _SUMMARY_ROW_TMPL = "  {:<27}{}"
+    
     def __init__(self):
-        self.testing_agent = TestingAgent()
-        self.orchestrator = LoanOrchestrator()
-        self.data_generator = TestDataGenerator()
         self.test_results: List[Dict] = []
+        # Per-result scalars as columns, parallel to test_results
+        self.columns = self._empty_columns()
+        # Orchestrator results by application fingerprint
+        self._decision_cache: Dict[Hashable, Dict] = {}
+        # Aggregates of test_results, recomputed when results are added
+        self._stats_cache: Optional[Dict] = None
+        # Rendered dashboard text, keyed on the results list and its length
+        self._display_cache: Optional[Tuple[Tuple[int, int], str]] = None
+    
+    # Agents and the generator are built on first use, so CLI modes only
+    # import what they run
+    @cached_property
+    def testing_agent(self):
+        from agents.testing_agent import TestingAgent
+        return TestingAgent()
+    
+    @cached_property
+    def orchestrator(self):
+        from orchestrator import orchestrator
+        return orchestrator
+    
+    @cached_property
+    def data_generator(self):
+        from tests.test_data_generator import TestDataGenerator
+        return TestDataGenerator()
+    
+    # One event loop for the dashboard's lifetime: the orchestrator's
+    # concurrency semaphore binds to the first loop that waits on it
+    @cached_property
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        return asyncio.new_event_loop()
+    
+    def _run(self, coro: Awaitable):
+        """Run a coroutine on the dashboard's event loop, then let background writes finish"""
+        async def settle():
+            try:
+                return await coro
+            finally:
+                await self.orchestrator.wait_for_pending()
+        
+        return self._loop.run_until_complete(settle())
+    
+    def close(self):
+        """Close the dashboard's event loop"""
+        loop = self.__dict__.pop("_loop", None)
+        if loop is not None:
+            loop.close()
+    
+    @staticmethod
+    def _empty_columns() -> Dict[str, Sequence]:
+        """Empty result columns: typed arrays for numbers and decision codes, lists for labels"""
+        return {
+            "passed": array("b"),
+            "decision": array("b"),
+            "confidence": array("d"),
+            "test_score": array("d"),
+            "fairness": array("d"),
+            "anomalies_detected": array("q"),
+            "risk_level": []
+        }
+    
+    def _extend_results(self, applications: List[Dict], results: List[Dict], test_reports: List[Dict]):
+        """Record a batch of test results and their scalar columns, growing each container once"""
+        # Reserve the batch's slots up front and fill them by index; extending
+        # from a generator would grow the list a few slots at a time
+        test_results = self.test_results
+        start = len(test_results)
+        test_results += [None] * len(test_reports)
+        for i, (app_data, result, test_report) in enumerate(zip(applications, results, test_reports), start):
+            test_results[i] = {
+                "application": app_data,
+                "decision_result": result,
+                "test_report": test_report
+            }
+        
+        columns = self.columns
+        columns["passed"].extend([report["passed"] for report in test_reports])
+        columns["decision"].extend(
+            [_DECISION_CODES.get(result["final_decision"], _UNKNOWN_DECISION) for result in results]
+        )
+        columns["confidence"].extend([result["confidence_score"] for result in results])
+        columns["test_score"].extend([report["test_score"] for report in test_reports])
+        columns["fairness"].extend([report["bias_check"]["fairness_score"] for report in test_reports])
+        columns["anomalies_detected"].extend(
+            [report["anomaly_detection"]["anomalies_detected"] for report in test_reports]
+        )
+        columns["risk_level"].extend([report["anomaly_detection"]["risk_level"] for report in test_reports])
+    
+    def clear_results(self):
+        """Discard all test results and cached state"""
+        self.test_results = []
+        self.columns = self._empty_columns()
+        self.__dict__.pop("testing_agent", None)  # Reset; rebuilt on next use
+        self._decision_cache.clear()
+        self._stats_cache = None
+        self._display_cache = None
+    
+    def _build_application(self, app_data: Dict) -> LoanApplicationRequest:
+        """Validate one generated application; edge cases may fail like an API request would"""
+        return LoanApplicationRequest.model_validate(app_data)
+    
+    def _decide_cached(self, applications: List[Dict],
+                       progress: Optional[Callable[[int], None]] = None) -> List[Optional[Dict]]:
+        """
+        Run applications through the orchestrator, reusing earlier decisions
+        
+        Args:
+            applications: Generated application data
+            progress: Called with the number of applications settled so far
+                each time an orchestrator decision completes
+            
+        Returns:
+            Decision results in TestingAgent form, in input order; None for
+            applications that fail request validation
+        """
+        keys = [_fingerprint(app_data) for app_data in applications]
+        results = [self._decision_cache.get(key) for key in keys]
+        
+        # Positions of each uncached application; identical applications in
+        # the batch share one orchestrator call
+        misses: Dict[Hashable, List[int]] = {}
+        for i, (key, result) in enumerate(zip(keys, results)):
+            if result is None:
+                misses.setdefault(key, []).append(i)
+        
+        # Applications the API would reject never reach the orchestrator
+        models: Dict[Hashable, LoanApplicationRequest] = {}
+        for key, positions in misses.items():
+            try:
+                models[key] = self._build_application(applications[positions[0]])
+            except ValidationError:
+                pass
+        misses = {key: misses[key] for key in models}
+        if not misses:
+            return results
+        
+        # Cached and invalid applications are settled before the batch starts
+        positions_by_call = list(misses.values())
+        settled = len(applications) - sum(map(len, positions_by_call))
+        
+        def on_complete(index: int):
+            nonlocal settled
+            settled += len(positions_by_call[index])
+            progress(settled)
+        
+        start_ns = time.perf_counter_ns()
+        responses = self._run(self.orchestrator.process_batch(
+            list(models.values()),
+            on_complete if progress is not None else None
+        ))
+        # Only cache decisions that cost more than the threshold on average
+        worth_caching = (time.perf_counter_ns() - start_ns) / len(misses) > DECISION_CACHE_MIN_NS
+        
+        for (key, positions), response in zip(misses.items(), responses):
+            result = _to_decision_result(response)
+            for i in positions:
+                results[i] = result
+            if worth_caching:
+                if len(self._decision_cache) >= DECISION_CACHE_SIZE:
+                    # Evict the oldest entry
+                    self._decision_cache.pop(next(iter(self._decision_cache)))
+                self._decision_cache[key] = result
+        return results
+    
+    async def _decide_or_error(self, index: int, app_data: Dict
+                               ) -> Tuple[int, Optional[LoanApplicationResponse], Optional[Exception]]:
+        """Validate and run one application, returning the error instead of raising it"""
+        try:
+            app = self._build_application(app_data)
+            return index, await self.orchestrator.process_application(app), None
+        except Exception as e:
+            return index, None, e
+    
+    @staticmethod
+    def _drop_invalid(applications: List[Dict], results: List[Optional[Dict]]
+                      ) -> Tuple[List[Dict], List[Dict]]:
+        """Drop applications that failed request validation, reporting how many"""
+        valid = [(app_data, result) for app_data, result in zip(applications, results) if result is not None]
+        skipped = len(applications) - len(valid)
+        if skipped:
+            print(f"   ⚠ Skipped {skipped} applications that fail request validation")
+        return [app_data for app_data, _ in valid], [result for _, result in valid]
     
     def run_test_suite(self, test_count: int = 20):
         """Run a comprehensive test suite"""
@@ -44,151 +329,184 @@ class TestingDashboard:
         
         print(f"✓ Generated {len(applications)} test applications\n")
         
-        # Process each application
+        # Process applications concurrently on the event loop; results come
+        # back in submission order, progress is reported as they complete
         print("🔄 Processing applications...")
-        for i, app_data in enumerate(applications, 1):
-            app = LoanApplication(**app_data)
+        with _progress_writer() as emit:
+            reported = 0
             
-            # Process through orchestrator
-            result = self.orchestrator.process_application(app)
+            def report(settled: int):
+                nonlocal reported
+                if settled // 5 > reported // 5:
+                    emit(f"   Processed {settled}/{test_count} applications...")
+                    reported = settled
             
-            # Validate with testing agent
-            test_report = self.testing_agent.analyze(app_data, result)
-            
-            self.test_results.append({
-                "application": app_data,
-                "decision_result": result,
-                "test_report": test_report
-            })
-            
-            # Progress indicator
-            if i % 5 == 0:
-                print(f"   Processed {i}/{test_count} applications...")
+            results = self._decide_cached(applications, report)
+        applications, results = self._drop_invalid(applications, results)
+        
+        # Validate the whole batch with the testing agent in one call
+        test_reports = self.testing_agent.analyze_batch(applications, results)
+        self._extend_results(applications, results, test_reports)
         
         print(f"✓ Completed processing\n")
         
         # Display results
         self.display_results()
     
+    def _compute_stats(self) -> Dict:
+        """Aggregate the result columns, cached until more results are added"""
+        total_tests = len(self.test_results)
+        if self._stats_cache is not None and self._stats_cache["total_tests"] == total_tests:
+            return self._stats_cache
+        
+        columns = self.columns
+        self._stats_cache = {
+            "total_tests": total_tests,
+            "passed_tests": sum(columns["passed"]),
+            "decisions": Counter(columns["decision"]),
+            "avg_confidence": sum(columns["confidence"]) / total_tests,
+            "avg_test_score": sum(columns["test_score"]) / total_tests,
+            "avg_fairness": sum(columns["fairness"]) / total_tests,
+            "total_anomalies": sum(columns["anomalies_detected"])
+        }
+        return self._stats_cache
+    
     def display_results(self):
         """Display test results in a formatted dashboard"""
         if not self.test_results:
             print("No test results available. Run test suite first.")
             return
         
+        # Re-viewing unchanged results reuses the rendered text
+        key = (id(self.test_results), len(self.test_results))
+        if self._display_cache is None or self._display_cache[0] != key:
+            self._display_cache = (key, self._render_results())
+        sys.stdout.write(self._display_cache[1])
+    
+    def _render_results(self) -> str:
+        """Render the dashboard for the current test results"""
         # Calculate statistics
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r["test_report"]["passed"])
+        stats = self._compute_stats()
+        total_tests = stats["total_tests"]
+        passed_tests = stats["passed_tests"]
         failed_tests = total_tests - passed_tests
         
         # Decision distribution
-        decisions = [r["decision_result"]["final_decision"] for r in self.test_results]
-        approved = decisions.count("APPROVED")
-        rejected = decisions.count("REJECTED")
-        conditional = decisions.count("CONDITIONAL")
-        
-        # Average scores
-        avg_confidence = sum(r["decision_result"]["confidence_score"] for r in self.test_results) / total_tests
-        avg_test_score = sum(r["test_report"]["test_score"] for r in self.test_results) / total_tests
-        avg_fairness = sum(r["test_report"]["bias_check"]["fairness_score"] for r in self.test_results) / total_tests
-        
-        # Anomalies
-        total_anomalies = sum(r["test_report"]["anomaly_detection"]["anomalies_detected"] 
-                             for r in self.test_results)
-        
-        # Display dashboard
-        print(f"\n{'='*70}")
-        print(f"📊 TESTING DASHBOARD - COMPREHENSIVE RESULTS")
-        print(f"{'='*70}\n")
+        approved = stats["decisions"][Decision.APPROVED]
+        rejected = stats["decisions"][Decision.REJECTED]
+        conditional = stats["decisions"][Decision.CONDITIONAL]
+        
+        # Percentages, each computed once
+        passed_pct = passed_tests / total_tests * 100
+        failed_pct = failed_tests / total_tests * 100
+        approved_pct = approved / total_tests * 100
+        rejected_pct = rejected / total_tests * 100
+        conditional_pct = conditional / total_tests * 100
+        
+        # Partition results for the detail sections in a single pass
+        failed_list, biased_tests, high_risk_tests = [], [], []
+        for r in self.test_results:
+            test_report = r["test_report"]
+            if not test_report["passed"]:
+                failed_list.append(r)
+            if test_report["bias_check"]["bias_detected"]:
+                biased_tests.append(r)
+            if test_report["anomaly_detection"]["risk_level"] in _HIGH_RISK_LEVELS:
+                high_risk_tests.append(r)
+        
+        row = self._ROW_TMPL.format
+        count_row = self._COUNT_ROW_TMPL.format
+        
+        # Build the dashboard, then write it in one call
+        lines = ["", self._RULE, "📊 TESTING DASHBOARD - COMPREHENSIVE RESULTS", self._RULE, ""]
         
         # Overview section
-        print(f"{'▶ OVERVIEW':<50}")
-        print(f"{'─'*70}")
-        print(f"  Total Tests Run:          {total_tests}")
-        print(f"  Tests Passed:             {passed_tests} ({passed_tests/total_tests*100:.1f}%)")
-        print(f"  Tests Failed:             {failed_tests} ({failed_tests/total_tests*100:.1f}%)")
-        print(f"  Status:                   {'✓ HEALTHY' if passed_tests/total_tests >= 0.80 else '⚠ NEEDS ATTENTION'}")
-        print()
+        lines += self._section("▶ OVERVIEW")
+        lines += [
+            row("Total Tests Run:", total_tests),
+            count_row("Tests Passed:", passed_tests, passed_pct),
+            count_row("Tests Failed:", failed_tests, failed_pct),
+            row("Status:", "✓ HEALTHY" if passed_tests / total_tests >= 0.80 else "⚠ NEEDS ATTENTION"),
+            ""
+        ]
         
         # Decision distribution
-        print(f"{'▶ DECISION DISTRIBUTION':<50}")
-        print(f"{'─'*70}")
-        print(f"  Approved:                 {approved} ({approved/total_tests*100:.1f}%)")
-        print(f"  Rejected:                 {rejected} ({rejected/total_tests*100:.1f}%)")
-        print(f"  Conditional:              {conditional} ({conditional/total_tests*100:.1f}%)")
-        print()
+        lines += self._section("▶ DECISION DISTRIBUTION")
+        lines += [
+            count_row("Approved:", approved, approved_pct),
+            count_row("Rejected:", rejected, rejected_pct),
+            count_row("Conditional:", conditional, conditional_pct),
+            ""
+        ]
         
         # Quality metrics
-        print(f"{'▶ QUALITY METRICS':<50}")
-        print(f"{'─'*70}")
-        print(f"  Average Confidence Score: {avg_confidence:.3f}")
-        print(f"  Average Test Score:       {avg_test_score:.3f}")
-        print(f"  Average Fairness Score:   {avg_fairness:.1f}%")
-        print(f"  Total Anomalies Detected: {total_anomalies}")
-        print()
+        lines += self._section("▶ QUALITY METRICS")
+        lines += [
+            row("Average Confidence Score:", f"{stats['avg_confidence']:.3f}"),
+            row("Average Test Score:", f"{stats['avg_test_score']:.3f}"),
+            row("Average Fairness Score:", f"{stats['avg_fairness']:.1f}%"),
+            row("Total Anomalies Detected:", stats["total_anomalies"]),
+            ""
+        ]
         
         # Failed tests details
         if failed_tests > 0:
-            print(f"{'▶ FAILED TESTS DETAILS':<50}")
-            print(f"{'─'*70}")
+            lines += self._section("▶ FAILED TESTS DETAILS")
             
-            failed_list = [r for r in self.test_results if not r["test_report"]["passed"]]
             for i, failed in enumerate(failed_list[:5], 1):  # Show first 5
                 app_name = failed["application"]["name"]
                 decision = failed["decision_result"]["final_decision"]
                 test_score = failed["test_report"]["test_score"]
                 
-                print(f"  {i}. {app_name}")
-                print(f"     Decision: {decision} | Test Score: {test_score:.3f}")
+                lines.append(f"  {i}. {app_name}")
+                lines.append(f"     Decision: {decision} | Test Score: {test_score:.3f}")
                 
                 # Show recommendations
                 for rec in failed["test_report"]["recommendations"][:2]:
-                    print(f"     → {rec}")
-                print()
+                    lines.append(f"     → {rec}")
+                lines.append("")
             
             if failed_tests > 5:
-                print(f"  ... and {failed_tests - 5} more failed tests\n")
+                lines += [f"  ... and {failed_tests - 5} more failed tests", ""]
         
         # Bias and fairness issues
-        biased_tests = [r for r in self.test_results 
-                       if r["test_report"]["bias_check"]["bias_detected"]]
-        
         if biased_tests:
-            print(f"{'▶ BIAS & FAIRNESS ALERTS':<50}")
-            print(f"{'─'*70}")
-            print(f"  Tests with Bias Indicators: {len(biased_tests)}\n")
+            lines += self._section("▶ BIAS & FAIRNESS ALERTS")
+            lines += [f"  Tests with Bias Indicators: {len(biased_tests)}", ""]
             
             for i, biased in enumerate(biased_tests[:3], 1):  # Show first 3
                 app_name = biased["application"]["name"]
                 fairness_score = biased["test_report"]["bias_check"]["fairness_score"]
                 indicators = biased["test_report"]["bias_check"]["bias_indicators"]
                 
-                print(f"  {i}. {app_name} (Fairness: {fairness_score:.1f}%)")
+                lines.append(f"  {i}. {app_name} (Fairness: {fairness_score:.1f}%)")
                 for indicator in indicators:
-                    print(f"     [{indicator['severity']}] {indicator['type']}")
-                print()
+                    lines.append(f"     [{indicator['severity']}] {indicator['type']}")
+                lines.append("")
         
         # High-risk anomalies
-        high_risk_tests = [r for r in self.test_results 
-                          if r["test_report"]["anomaly_detection"]["risk_level"] in ["HIGH", "CRITICAL"]]
-        
         if high_risk_tests:
-            print(f"{'▶ HIGH-RISK ANOMALIES':<50}")
-            print(f"{'─'*70}")
-            print(f"  High-Risk Tests: {len(high_risk_tests)}\n")
+            lines += self._section("▶ HIGH-RISK ANOMALIES")
+            lines += [f"  High-Risk Tests: {len(high_risk_tests)}", ""]
             
             for i, risky in enumerate(high_risk_tests[:3], 1):
                 app_name = risky["application"]["name"]
                 risk_level = risky["test_report"]["anomaly_detection"]["risk_level"]
                 anomalies = risky["test_report"]["anomaly_detection"]["anomalies"]
                 
-                print(f"  {i}. {app_name} (Risk: {risk_level})")
+                lines.append(f"  {i}. {app_name} (Risk: {risk_level})")
                 for anomaly in anomalies:
-                    print(f"     [{anomaly['severity']}] {anomaly['type']}")
-                    print(f"     {anomaly['description']}")
-                print()
+                    lines.append(f"     [{anomaly['severity']}] {anomaly['type']}")
+                    lines.append(f"     {anomaly['description']}")
+                lines.append("")
         
-        print(f"{'='*70}\n")
+        lines += [self._RULE, ""]
+        return "\n".join(lines) + "\n"
+    
+    @classmethod
+    def _section(cls, title: str) -> List[str]:
+        """Section header lines: padded title and a thin rule"""
+        return [cls._SECTION_TMPL.format(title), cls._THIN_RULE]
     
     def run_fairness_test(self):
         """Run fairness and bias testing"""
@@ -202,48 +520,59 @@ class TestingDashboard:
         print(f"Processing {len(applications)} applications...\n")
         
         fairness_results = []
-        
-        for app_data in applications:
-            app = LoanApplication(**app_data)
-            result = self.orchestrator.process_application(app)
-            test_report = self.testing_agent.analyze(app_data, result)
+        # Overall metrics are accumulated while the results are collected
+        fairness_sum = 0.0
+        total_bias = 0
+        
+        # Decisions are made concurrently; analysis stays in order because the
+        # testing agent compares each case with the ones before it
+        applications, results = self._drop_invalid(applications, self._decide_cached(applications))
+        for app_data, result in zip(applications, results):
+            bias_check = self.testing_agent.analyze(app_data, result)["bias_check"]
             
             fairness_results.append({
                 "application": app_data,
                 "decision": result["final_decision"],
-                "fairness_score": test_report["bias_check"]["fairness_score"],
-                "bias_indicators": test_report["bias_check"]["bias_indicators"]
+                "fairness_score": bias_check["fairness_score"],
+                "bias_indicators": bias_check["bias_indicators"]
             })
-        
-        # Analyze consistency
-        print(f"{'▶ CONSISTENCY ANALYSIS':<50}")
-        print(f"{'─'*70}")
-        
-        # Group similar applications
-        for i in range(0, len(fairness_results), 2):
-            if i + 1 < len(fairness_results):
-                app1 = fairness_results[i]
-                app2 = fairness_results[i + 1]
-                
-                print(f"\n  Pair {i//2 + 1}:")
-                print(f"    App 1: {app1['decision']} (Fairness: {app1['fairness_score']:.1f}%)")
-                print(f"    App 2: {app2['decision']} (Fairness: {app2['fairness_score']:.1f}%)")
-                
-                if app1['decision'] != app2['decision']:
-                    print(f"    ⚠️  INCONSISTENCY DETECTED - Similar apps, different decisions!")
-                else:
-                    print(f"    ✓ Consistent decisions")
+            fairness_sum += bias_check["fairness_score"]
+            total_bias += len(bias_check["bias_indicators"])
+        
+        # Analyze consistency; the report is written in one call
+        lines = self._section("▶ CONSISTENCY ANALYSIS")
+        
+        # Group similar applications; zip over one iterator yields consecutive
+        # pairs and drops an unpaired trailing result
+        pairs = iter(fairness_results)
+        for pair_number, (app1, app2) in enumerate(zip(pairs, pairs), 1):
+            lines += [
+                "",
+                f"  Pair {pair_number}:",
+                f"    App 1: {app1['decision']} (Fairness: {app1['fairness_score']:.1f}%)",
+                f"    App 2: {app2['decision']} (Fairness: {app2['fairness_score']:.1f}%)"
+            ]
+            
+            if app1['decision'] != app2['decision']:
+                lines.append("    ⚠️  INCONSISTENCY DETECTED - Similar apps, different decisions!")
+            else:
+                lines.append("    ✓ Consistent decisions")
         
         # Overall fairness score
-        avg_fairness = sum(r['fairness_score'] for r in fairness_results) / len(fairness_results)
-        total_bias = sum(len(r['bias_indicators']) for r in fairness_results)
-        
-        print(f"\n{'▶ OVERALL FAIRNESS METRICS':<50}")
-        print(f"{'─'*70}")
-        print(f"  Average Fairness Score:    {avg_fairness:.1f}%")
-        print(f"  Total Bias Indicators:     {total_bias}")
-        print(f"  Status:                    {'✓ FAIR' if avg_fairness >= 85 else '⚠ REVIEW NEEDED'}")
-        print(f"\n{'='*70}\n")
+        avg_fairness = fairness_sum / len(fairness_results)
+        
+        row = self._SUMMARY_ROW_TMPL.format
+        lines.append("")
+        lines += self._section("▶ OVERALL FAIRNESS METRICS")
+        lines += [
+            row("Average Fairness Score:", f"{avg_fairness:.1f}%"),
+            row("Total Bias Indicators:", total_bias),
+            row("Status:", "✓ FAIR" if avg_fairness >= 85 else "⚠ REVIEW NEEDED"),
+            "",
+            self._RULE,
+            ""
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def run_stress_test(self, count: int = 50):
         """Run stress test with many applications"""
@@ -251,50 +580,80 @@ class TestingDashboard:
         print(f"💪 STRESS TESTING - {count} Applications")
         print(f"{'='*70}\n")
         
-        import time
-        
         applications = self.data_generator.generate_stress_test_batch(count)
         
-        start_time = time.time()
+        print("Processing applications...")
+        # Progress lines are written off the event loop
+        with _progress_writer() as emit:
+            # Monotonic clock; immune to wall-clock adjustments mid-run
+            start_ns = time.perf_counter_ns()
+            success_count, error_count = self._run(self._stress(applications, start_ns, emit))
+        
+        total_time = (time.perf_counter_ns() - start_ns) * 1e-9
+        avg_time = total_time / max(success_count, 1)
+        throughput = count / total_time
+        
+        row = self._SUMMARY_ROW_TMPL.format
+        lines = [""] + self._section("▶ STRESS TEST RESULTS") + [
+            row("Total Applications:", count),
+            row("Successful:", success_count),
+            row("Errors:", error_count),
+            row("Total Time:", f"{total_time:.2f} seconds"),
+            row("Average Time/App:", f"{avg_time:.3f} seconds"),
+            row("Throughput:", f"{throughput:.1f} applications/second"),
+            row("Status:", "✓ PASSED" if error_count == 0 else "⚠ ERRORS DETECTED"),
+            "",
+            self._RULE,
+            ""
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    async def _stress(self, applications: List[Dict], start_ns: int,
+                      emit: Callable[[str], None]) -> Tuple[int, int]:
+        """
+        Process every application concurrently, reporting progress as they complete
+        
+        Applications that fail request validation are counted as errors.
+        """
+        count = len(applications)
         success_count = 0
         error_count = 0
         
-        print("Processing applications...")
-        for i, app_data in enumerate(applications, 1):
-            try:
-                app = LoanApplication(**app_data)
-                result = self.orchestrator.process_application(app)
+        outcomes = asyncio.as_completed(
+            [self._decide_or_error(i, app) for i, app in enumerate(applications, 1)]
+        )
+        for done, outcome in enumerate(outcomes, 1):
+            index, result, error = await outcome
+            if error is None:
                 success_count += 1
-                
-                if i % 10 == 0:
-                    elapsed = time.time() - start_time
-                    rate = i / elapsed
-                    print(f"  Processed {i}/{count} ({rate:.1f} apps/sec)")
-            
-            except Exception as e:
+            else:
                 error_count += 1
-                print(f"  ERROR on application {i}: {str(e)}")
-        
-        end_time = time.time()
-        total_time = end_time - start_time
-        avg_time = total_time / count
-        throughput = count / total_time
+                emit(f"  ERROR on application {index}: {str(error)}")
+            
+            if done % 10 == 0:
+                elapsed = (time.perf_counter_ns() - start_ns) * 1e-9
+                rate = done / elapsed
+                emit(f"  Processed {done}/{count} ({rate:.1f} apps/sec)")
         
-        print(f"\n{'▶ STRESS TEST RESULTS':<50}")
-        print(f"{'─'*70}")
-        print(f"  Total Applications:        {count}")
-        print(f"  Successful:                {success_count}")
-        print(f"  Errors:                    {error_count}")
-        print(f"  Total Time:                {total_time:.2f} seconds")
-        print(f"  Average Time/App:          {avg_time:.3f} seconds")
-        print(f"  Throughput:                {throughput:.1f} applications/second")
-        print(f"  Status:                    {'✓ PASSED' if error_count == 0 else '⚠ ERRORS DETECTED'}")
-        print(f"\n{'='*70}\n")
+        return success_count, error_count
     
-    def export_results(self, filename: str = "test_results.json"):
-        """Export test results to file"""
-        with open(filename, 'w') as f:
-            json.dump(self.test_results, f, indent=2)
+    def export_results(self, filename: str = "test_results.json", pretty: bool = False):
+        """Export test results to file (one JSON record per line for .ndjson)"""
+        import json
+        
+        if filename.endswith(".ndjson"):
+            # Stream compact records so only one is encoded at a time
+            encode = json.JSONEncoder(separators=(",", ":")).encode
+            with open(filename, 'w') as f:
+                f.writelines(encode(r) + "\n" for r in self.test_results)
+        else:
+            # indent forces the pure-Python encoder, so it is opt-in
+            if pretty:
+                content = json.dumps(self.test_results, indent=2)
+            else:
+                content = json.dumps(self.test_results, separators=(",", ":"))
+            with open(filename, 'w') as f:
+                f.write(content)
         
         print(f"✓ Exported {len(self.test_results)} test results to {filename}")
     
@@ -332,8 +691,7 @@ class TestingDashboard:
                     filename = "test_results.json"
                 self.export_results(filename)
             elif choice == "7":
-                self.test_results = []
-                self.testing_agent = TestingAgent()  # Reset
+                self.clear_results()
                 print("✓ Results cleared")
             elif choice == "8":
                 print("\n👋 Exiting Testing Dashboard\n")
@@ -351,21 +709,25 @@ def main():
                        default="interactive", help="Testing mode")
     parser.add_argument("--count", type=int, default=20, help="Number of test applications")
     parser.add_argument("--export", type=str, help="Export results to file")
+    parser.add_argument("--pretty", action="store_true", help="Indent exported JSON")
     
     args = parser.parse_args()
     
     dashboard = TestingDashboard()
     
-    if args.mode == "interactive":
-        dashboard.interactive_menu()
-    elif args.mode == "standard":
-        dashboard.run_test_suite(test_count=args.count)
-        if args.export:
-            dashboard.export_results(args.export)
-    elif args.mode == "fairness":
-        dashboard.run_fairness_test()
-    elif args.mode == "stress":
-        dashboard.run_stress_test(count=args.count)
+    try:
+        if args.mode == "interactive":
+            dashboard.interactive_menu()
+        elif args.mode == "standard":
+            dashboard.run_test_suite(test_count=args.count)
+            if args.export:
+                dashboard.export_results(args.export, pretty=args.pretty)
+        elif args.mode == "fairness":
+            dashboard.run_fairness_test()
+        elif args.mode == "stress":
+            dashboard.run_stress_test(count=args.count)
+    finally:
+        dashboard.close()
 
 
 if __name__ == "__main__":